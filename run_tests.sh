@@ -22,6 +22,14 @@ export LOG_LEVEL=INFO
 # Crear directorio para logs si no existe
 mkdir -p logs
 
+# Ejecución en paralelo (pytest-xdist) para las suites dominadas por E/S.
+# Se reparte por archivo para que los tests de un mismo módulo compartan
+# proceso (y sus fixtures); si xdist no está instalado se ejecuta en serie.
+PARALLEL_OPTS=""
+if python -c "import xdist" 2>/dev/null; then
+    PARALLEL_OPTS="-n auto --dist loadfile"
+fi
+
 # Función para mostrar ayuda
 show_help() {
     echo -e "${BLUE}=== Script de Pruebas para API NGX ===${NC}"
@@ -51,11 +59,11 @@ case "$1" in
         ;;
     "integration")
         echo -e "${BLUE}=== Ejecutando pruebas de integración ===${NC}"
-        python -m pytest tests/integration/ -v
+        python -m pytest tests/integration/ -v $PARALLEL_OPTS
         ;;
     "security")
         echo -e "${BLUE}=== Ejecutando pruebas de seguridad ===${NC}"
-        python -m pytest tests/security/ -v
+        python -m pytest tests/security/ -v $PARALLEL_OPTS
         ;;
     "auth")
         echo -e "${BLUE}=== Ejecutando pruebas de autenticación ===${NC}"
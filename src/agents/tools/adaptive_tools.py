@@ -6,6 +6,33 @@ from agents import function_tool
 from typing import Dict, Any, List
 import re
 
+# Palabras clave y su peso para cada programa
+_PRIME_KEYWORDS = {
+    'tiempo': 0.8, 'ocupado': 0.9, 'estrés': 0.7, 'productividad': 0.9,
+    'empresa': 0.8, 'rendimiento': 0.9, 'optimizar': 0.9, 'reuniones': 0.7,
+    'viajar': 0.7, 'viaje': 0.7, 'ejecutivo': 1.0, 'resultados': 0.8, 
+    'eficiencia': 0.9, 'trabajo': 0.7, 'negocio': 0.8, 'ceo': 1.0,
+    'director': 0.9, 'gerente': 0.8, 'emprendedor': 0.9, 'startup': 0.9
+}
+
+_LONGEVITY_KEYWORDS = {
+    'dolor': 0.8, 'dolores': 0.8, 'articulaciones': 0.9, 'movilidad': 0.9, 
+    'energía': 0.7, 'prevenir': 0.8, 'prevención': 0.8, 'independencia': 0.9, 
+    'nietos': 0.9, 'jubilación': 1.0, 'jubilado': 1.0, 'retirado': 1.0,
+    'caídas': 0.9, 'caída': 0.9, 'memoria': 0.8, 'calidad de vida': 0.9, 
+    'salud': 0.7, 'bienestar': 0.7, 'vitalidad': 0.8, 'mayor': 0.7
+}
+
+# Enfoque sugerido según la razón del cambio de programa
+_REASON_FOCUS = {
+    "jubilación": "prevención y calidad de vida",
+    "empresa": "optimización y rendimiento",
+    "estrés": "productividad y energía",
+    "dolor": "bienestar y movilidad",
+    "tiempo": "eficiencia y resultados",
+    "familia": "independencia y vitalidad"
+}
+
 @function_tool
 async def analyze_customer_profile(transcript: str, customer_age: int = None) -> Dict[str, Any]:
     """
@@ -19,31 +46,22 @@ async def analyze_customer_profile(transcript: str, customer_age: int = None) ->
     Returns:
         Analysis with program recommendation and confidence score
     """
-    # Palabras clave y su peso para cada programa
-    prime_keywords = {
-        'tiempo': 0.8, 'ocupado': 0.9, 'estrés': 0.7, 'productividad': 0.9,
-        'empresa': 0.8, 'rendimiento': 0.9, 'optimizar': 0.9, 'reuniones': 0.7,
-        'viajar': 0.7, 'viaje': 0.7, 'ejecutivo': 1.0, 'resultados': 0.8, 
-        'eficiencia': 0.9, 'trabajo': 0.7, 'negocio': 0.8, 'ceo': 1.0,
-        'director': 0.9, 'gerente': 0.8, 'emprendedor': 0.9, 'startup': 0.9
-    }
-    
-    longevity_keywords = {
-        'dolor': 0.8, 'dolores': 0.8, 'articulaciones': 0.9, 'movilidad': 0.9, 
-        'energía': 0.7, 'prevenir': 0.8, 'prevención': 0.8, 'independencia': 0.9, 
-        'nietos': 0.9, 'jubilación': 1.0, 'jubilado': 1.0, 'retirado': 1.0,
-        'caídas': 0.9, 'caída': 0.9, 'memoria': 0.8, 'calidad de vida': 0.9, 
-        'salud': 0.7, 'bienestar': 0.7, 'vitalidad': 0.8, 'mayor': 0.7
-    }
-    
     # Análisis del transcript
-    text_lower = transcript.lower()
+    if transcript.strip():
+        text_lower = transcript.lower()
+        
+        # Buscar cada palabra clave una sola vez; las coincidencias se reutilizan
+        # tanto para las puntuaciones como para las señales detectadas
+        prime_matches = [word for word in _PRIME_KEYWORDS if word in text_lower]
+        longevity_matches = [word for word in _LONGEVITY_KEYWORDS if word in text_lower]
+    else:
+        # Transcript vacío (inicio de la llamada): no hay señales que buscar
+        prime_matches = []
+        longevity_matches = []
     
     # Calcular puntuaciones
-    prime_score = sum(weight for word, weight in prime_keywords.items() 
-                     if word in text_lower)
-    longevity_score = sum(weight for word, weight in longevity_keywords.items() 
-                         if word in text_lower)
+    prime_score = sum(_PRIME_KEYWORDS[word] for word in prime_matches)
+    longevity_score = sum(_LONGEVITY_KEYWORDS[word] for word in longevity_matches)
     
     # Factor edad si está disponible
     age_factor = 1.0
@@ -73,13 +91,8 @@ async def analyze_customer_profile(transcript: str, customer_age: int = None) ->
         confidence = max(prime_normalized, longevity_normalized)
     
     # Extraer insights específicos
-    detected_signals = []
-    for word in prime_keywords:
-        if word in text_lower:
-            detected_signals.append(f"ejecutivo ({word})")
-    for word in longevity_keywords:
-        if word in text_lower:
-            detected_signals.append(f"senior ({word})")
+    detected_signals = [f"ejecutivo ({word})" for word in prime_matches]
+    detected_signals.extend(f"senior ({word})" for word in longevity_matches)
     
     return {
         "recommended_program": recommended_program,
@@ -137,20 +150,11 @@ async def switch_program_focus(from_program: str, to_program: str, reason: str)
     import random
     transition_template = random.choice(transition_phrases)
     
-    # Personalizar según la razón
-    reason_mapping = {
-        "jubilación": "prevención y calidad de vida",
-        "empresa": "optimización y rendimiento",
-        "estrés": "productividad y energía",
-        "dolor": "bienestar y movilidad",
-        "tiempo": "eficiencia y resultados",
-        "familia": "independencia y vitalidad"
-    }
-    
-    # Encontrar palabra clave en la razón
+    # Personalizar según la razón: encontrar palabra clave en la razón
     focus_keyword = "tus objetivos"
-    for keyword, focus in reason_mapping.items():
-        if keyword in reason.lower():
+    reason_lower = reason.lower()
+    for keyword, focus in _REASON_FOCUS.items():
+        if keyword in reason_lower:
             focus_keyword = focus
             break
     
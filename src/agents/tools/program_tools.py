@@ -4,24 +4,21 @@ Herramientas relacionadas con la información y gestión de los programas NGX.
 from agents import function_tool
 from src.conversation.flows.basic_flow import ConversationFlow # Para acceder a program_config
 from src.conversation.prompts import PRICE_OBJECTION_TEMPLATE # Importar plantilla
+from functools import lru_cache
 from typing import Optional
 
-@function_tool
-async def get_program_details(program_name: str) -> str:
+@lru_cache(maxsize=8)
+def _build_program_details(program_type_upper: str) -> str:
     """
-    Provides detailed information about a specified NGX program.
-    Use this tool to answer questions about program specifics like price, duration, key benefits, etc.
+    Construye (y memoiza) el texto de detalles de un programa.
+    El resultado solo depende del programa, por lo que se calcula una vez por programa.
 
     Args:
-        program_name: The name of the program (PRIME or LONGEVITY).
+        program_type_upper: Programa validado en mayúsculas (PRIME o LONGEVITY).
 
     Returns:
-        A string containing key details of the program.
+        Texto con los detalles clave del programa.
     """
-    program_type_upper = program_name.upper()
-    if program_type_upper not in ["PRIME", "LONGEVITY"]:
-        return "Error: Programa no válido. Por favor, especifica PRIME o LONGEVITY."
-
     # Usamos ConversationFlow para obtener la configuración del programa de forma centralizada.
     # En un escenario real, esto podría venir de una base de datos o un archivo de configuración más robusto.
     flow_simulator = ConversationFlow(program_type=program_type_upper)
@@ -42,7 +39,52 @@ async def get_program_details(program_name: str) -> str:
     # Podríamos añadir más detalles si es necesario, como la garantía.
     # Por ejemplo: "- Garantía de satisfacción de 30 días\n"
 
-    return details 
+    return details
+
+@lru_cache(maxsize=8)
+def _build_price_objection_response(program_type_upper: str) -> str:
+    """
+    Construye (y memoiza) la respuesta a la objeción de precio de un programa.
+    El resultado solo depende del programa, por lo que se calcula una vez por programa.
+
+    Args:
+        program_type_upper: Programa validado en mayúsculas (PRIME o LONGEVITY).
+
+    Returns:
+        Respuesta a la objeción de precio basada en la plantilla.
+    """
+    flow_simulator = ConversationFlow(program_type=program_type_upper)
+    config = flow_simulator.program_config
+
+    response = PRICE_OBJECTION_TEMPLATE.format(
+        programa=program_type_upper,
+        beneficio_principal=config["key_benefits"][0], # Tomamos el primer beneficio como principal
+        beneficio_1=config["key_benefits"][1] if len(config["key_benefits"]) > 1 else "mejor salud general",
+        beneficio_2=config["key_benefits"][2] if len(config["key_benefits"]) > 2 else "mayor bienestar",
+        beneficio_3=config["key_benefits"][3] if len(config["key_benefits"]) > 3 else "calidad de vida mejorada",
+        precio_completo=config["price_full"],
+        precio_mensual=config["price_monthly"],
+        meses=config["months"]
+    )
+    return response
+
+@function_tool
+async def get_program_details(program_name: str) -> str:
+    """
+    Provides detailed information about a specified NGX program.
+    Use this tool to answer questions about program specifics like price, duration, key benefits, etc.
+
+    Args:
+        program_name: The name of the program (PRIME or LONGEVITY).
+
+    Returns:
+        A string containing key details of the program.
+    """
+    program_type_upper = program_name.upper()
+    if program_type_upper not in ["PRIME", "LONGEVITY"]:
+        return "Error: Programa no válido. Por favor, especifica PRIME o LONGEVITY."
+
+    return _build_program_details(program_type_upper)
 
 @function_tool
 async def handle_price_objection(program_name: str, customer_concerns: Optional[str] = None) -> str:
@@ -64,20 +106,6 @@ async def handle_price_objection(program_name: str, customer_concerns: Optional[
     if program_type_upper not in ["PRIME", "LONGEVITY"]:
         return "Error: Programa no válido para manejar objeción de precio. Por favor, especifica PRIME o LONGEVITY."
 
-    flow_simulator = ConversationFlow(program_type=program_type_upper)
-    config = flow_simulator.program_config
-
     # Podríamos usar customer_concerns para una lógica más avanzada en el futuro,
     # por ahora, la plantilla es bastante genérica.
-
-    response = PRICE_OBJECTION_TEMPLATE.format(
-        programa=program_type_upper,
-        beneficio_principal=config["key_benefits"][0], # Tomamos el primer beneficio como principal
-        beneficio_1=config["key_benefits"][1] if len(config["key_benefits"]) > 1 else "mejor salud general",
-        beneficio_2=config["key_benefits"][2] if len(config["key_benefits"]) > 2 else "mayor bienestar",
-        beneficio_3=config["key_benefits"][3] if len(config["key_benefits"]) > 3 else "calidad de vida mejorada",
-        precio_completo=config["price_full"],
-        precio_mensual=config["price_monthly"],
-        meses=config["months"]
-    )
-    return response 
\ No newline at end of file
+    return _build_price_objection_response(program_type_upper) 
\ No newline at end of file
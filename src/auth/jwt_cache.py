@@ -0,0 +1,110 @@
+"""
+Caché en memoria de payloads JWT ya validados.
+
+Evita repetir la verificación de firma (jwt.decode) cuando el mismo token
+llega en varias solicitudes seguidas. Solo se guardan tokens cuya firma ya
+se validó, y cada entrada caduca en el "exp" del propio token o al cumplirse
+el TTL de la caché, lo que ocurra antes.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Configuración de la caché (JWT_CACHE_TTL_SECONDS=0 la desactiva)
+JWT_CACHE_TTL_SECONDS = float(os.getenv("JWT_CACHE_TTL_SECONDS", "30"))
+JWT_CACHE_MAX_SIZE = int(os.getenv("JWT_CACHE_MAX_SIZE", "10000"))
+
+# huella del token -> (payload, instante de caducidad)
+_cache: Dict[bytes, Tuple[Dict[str, Any], float]] = {}
+_lock = threading.Lock()
+
+def _cache_key(token: str) -> bytes:
+    """
+    Calcula la clave de caché de un token sin guardar el token en claro.
+
+    Args:
+        token: Token JWT
+
+    Returns:
+        bytes: Huella SHA-256 truncada a 16 bytes
+    """
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+def get_cached_payload(token: str) -> Optional[Dict[str, Any]]:
+    """
+    Obtiene el payload validado de un token si está en caché y no ha caducado.
+
+    Args:
+        token: Token JWT
+
+    Returns:
+        Optional[Dict[str, Any]]: Copia del payload, o None si no hay entrada válida
+    """
+    if JWT_CACHE_TTL_SECONDS <= 0:
+        return None
+
+    key = _cache_key(token)
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        payload, expires_at = entry
+        if time.time() >= expires_at:
+            del _cache[key]
+            return None
+    return dict(payload)
+
+def cache_payload(token: str, payload: Dict[str, Any]) -> None:
+    """
+    Guarda el payload de un token cuya firma ya se ha verificado.
+
+    Los tokens sin "exp" numérico no se guardan, para no prolongar la
+    validez de un token más allá de lo que indica el propio token.
+
+    Args:
+        token: Token JWT validado
+        payload: Payload devuelto por jwt.decode
+    """
+    if JWT_CACHE_TTL_SECONDS <= 0:
+        return
+
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)):
+        return
+
+    now = time.time()
+    expires_at = min(float(exp), now + JWT_CACHE_TTL_SECONDS)
+    if expires_at <= now:
+        return
+
+    with _lock:
+        if len(_cache) >= JWT_CACHE_MAX_SIZE:
+            _evict(now)
+        _cache[_cache_key(token)] = (dict(payload), expires_at)
+
+def _evict(now: float) -> None:
+    """
+    Libera espacio en la caché (se llama con el lock adquirido).
+
+    Primero elimina las entradas caducadas; si no basta, descarta la
+    entrada más antigua.
+
+    Args:
+        now: Instante actual
+    """
+    expired = [key for key, (_, expires_at) in _cache.items() if expires_at <= now]
+    for key in expired:
+        del _cache[key]
+    if _cache and len(_cache) >= JWT_CACHE_MAX_SIZE:
+        del _cache[next(iter(_cache))]
+
+def clear_jwt_cache() -> None:
+    """Vacía la caché de payloads JWT."""
+    with _lock:
+        _cache.clear()
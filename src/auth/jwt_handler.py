@@ -13,6 +13,8 @@ import os
 import logging
 from dotenv import load_dotenv
 
+from src.auth.jwt_cache import get_cached_payload, cache_payload
+
 # Cargar variables de entorno
 load_dotenv()
 
@@ -106,6 +108,9 @@ class JWTHandler:
         """
         Decodifica y valida un token JWT.
         
+        Los payloads ya validados se sirven desde la caché de JWT hasta su
+        expiración; los tokens inválidos nunca se guardan.
+        
         Args:
             token: Token JWT a decodificar
             
@@ -115,8 +120,13 @@ class JWTHandler:
         Raises:
             jwt.PyJWTError: Si el token es inválido o ha expirado
         """
+        cached = get_cached_payload(token)
+        if cached is not None:
+            return cached
+        
         try:
             payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+            cache_payload(token, payload)
             return payload
         except jwt.ExpiredSignatureError:
             logger.warning("Token JWT expirado")
@@ -3,6 +3,7 @@ Definición del flujo básico de conversación de ventas para los programas NGX.
 Estructura las etapas y transiciones del proceso de venta.
 """
 
+import re
 from enum import Enum
 from typing import Dict, Any, List
 
@@ -25,6 +26,134 @@ class Objection(str, Enum):
     DECISION_MAKER = "decision_maker"  # "Necesito consultarlo"
     TIMING = "timing"                # "No es el momento adecuado"
 
+# Transiciones válidas para cada fase (conjuntos indexados por el propio enum)
+_VALID_TRANSITIONS = {
+    ConversationPhase.GREETING: frozenset({
+        ConversationPhase.EXPLORATION,
+        ConversationPhase.OBJECTION_HANDLING
+    }),
+    ConversationPhase.EXPLORATION: frozenset({
+        ConversationPhase.PRESENTATION,
+        ConversationPhase.OBJECTION_HANDLING
+    }),
+    ConversationPhase.PRESENTATION: frozenset({
+        ConversationPhase.OBJECTION_HANDLING,
+        ConversationPhase.CLOSING
+    }),
+    ConversationPhase.OBJECTION_HANDLING: frozenset({
+        ConversationPhase.PRESENTATION,
+        ConversationPhase.CLOSING,
+        ConversationPhase.FOLLOW_UP
+    }),
+    ConversationPhase.CLOSING: frozenset({
+        ConversationPhase.OBJECTION_HANDLING,
+        ConversationPhase.FOLLOW_UP
+    }),
+    ConversationPhase.FOLLOW_UP: frozenset()  # No hay transiciones desde FOLLOW_UP (fase final)
+}
+
+# Palabras clave que indican cada fase
+_PHASE_KEYWORDS = {
+    ConversationPhase.GREETING: (
+        "hola", "bienvenido", "gusto conocerte", "gracias por completar", 
+        "evaluación", "¿cómo estás?", "¿qué tal tu día?"
+    ),
+    ConversationPhase.EXPLORATION: (
+        "cuéntame más", "¿qué buscas?", "objetivos", "¿qué es importante para ti?",
+        "¿qué te gustaría mejorar?", "prioridades", "¿qué te motivó?"
+    ),
+    ConversationPhase.PRESENTATION: (
+        "nuestro programa", "te ofrecemos", "beneficios", "incluye", 
+        "está diseñado para", "funciona así", "consiste en"
+    ),
+    ConversationPhase.OBJECTION_HANDLING: (
+        "entiendo tu preocupación", "es un punto válido", "muchos se preguntan",
+        "respecto al precio", "en cuanto al tiempo", "garantía"
+    ),
+    ConversationPhase.CLOSING: (
+        "próximos pasos", "empezar", "iniciar", "agendar", "sesión inicial",
+        "reservar tu lugar", "proceso de inscripción"
+    ),
+    ConversationPhase.FOLLOW_UP: (
+        "ha sido un placer", "estaremos en contacto", "nos vemos pronto",
+        "te enviaré un correo", "hasta pronto", "cualquier duda"
+    )
+}
+
+# Palabras clave que indican cada tipo de objeción
+_OBJECTION_KEYWORDS = {
+    Objection.PRICE: (
+        "caro", "costoso", "precio", "inversión", "pago", "presupuesto", "gasto"
+    ),
+    Objection.TIME: (
+        "tiempo", "ocupado", "agenda", "horario", "compromisos", "disponibilidad"
+    ),
+    Objection.VALUE: (
+        "vale la pena", "beneficio", "retorno", "inversión", "valor"
+    ),
+    Objection.RESULTS: (
+        "funciona", "resultados", "efectivo", "evidencia", "pruebas", "estudios"
+    ),
+    Objection.COMPETITION: (
+        "otra opción", "alternativa", "comparado", "diferencia", "competencia"
+    ),
+    Objection.DECISION_MAKER: (
+        "consultar", "esposo", "esposa", "pareja", "jefe", "pensar", "decidir"
+    ),
+    Objection.TIMING: (
+        "ahora no", "más adelante", "futuro", "momento", "después", "luego"
+    )
+}
+
+# Alternancia precompilada de las palabras clave de cada tipo de objeción
+_OBJECTION_PATTERNS = {
+    objection_type: re.compile('|'.join(map(re.escape, keywords)))
+    for objection_type, keywords in _OBJECTION_KEYWORDS.items()
+}
+
+# Configuración específica de cada programa (compartida; tratar como solo lectura)
+_PROGRAM_CONFIGS = {
+    "PRIME": {
+        "price_full": 1997,
+        "price_monthly": 697,
+        "months": 3,
+        "key_benefits": [
+            "rendimiento cognitivo optimizado",
+            "energía sostenible durante el día",
+            "mayor capacidad de foco y concentración",
+            "mejor manejo del estrés"
+        ],
+        "target_audience": "profesionales de alto rendimiento",
+        "main_pain_points": [
+            "fatiga mental",
+            "caída de energía durante el día",
+            "dificultad para concentrarse",
+            "estrés crónico",
+            "problemas de sueño"
+        ]
+    },
+    "LONGEVITY": {
+        "price_full": 2497,
+        "price_monthly": 647,
+        "months": 4,
+        "key_benefits": [
+            "mayor vitalidad diaria",
+            "mejor función cognitiva",
+            "mantenimiento de masa muscular",
+            "optimización metabólica",
+            "mejora en marcadores de salud"
+        ],
+        "target_audience": "adultos interesados en envejecimiento saludable",
+        "main_pain_points": [
+            "pérdida de energía",
+            "disminución de fuerza física",
+            "problemas de memoria",
+            "recuperación lenta",
+            "preocupación por independencia futura"
+        ]
+    }
+}
+
 class ConversationFlow:
     """
     Define el flujo de la conversación de ventas, incluyendo transiciones 
@@ -56,47 +185,8 @@ class ConversationFlow:
         Returns:
             Dict[str, Any]: Configuración del programa
         """
-        if program_type == "PRIME":
-            return {
-                "price_full": 1997,
-                "price_monthly": 697,
-                "months": 3,
-                "key_benefits": [
-                    "rendimiento cognitivo optimizado",
-                    "energía sostenible durante el día",
-                    "mayor capacidad de foco y concentración",
-                    "mejor manejo del estrés"
-                ],
-                "target_audience": "profesionales de alto rendimiento",
-                "main_pain_points": [
-                    "fatiga mental",
-                    "caída de energía durante el día",
-                    "dificultad para concentrarse",
-                    "estrés crónico",
-                    "problemas de sueño"
-                ]
-            }
-        else:  # LONGEVITY
-            return {
-                "price_full": 2497,
-                "price_monthly": 647,
-                "months": 4,
-                "key_benefits": [
-                    "mayor vitalidad diaria",
-                    "mejor función cognitiva",
-                    "mantenimiento de masa muscular",
-                    "optimización metabólica",
-                    "mejora en marcadores de salud"
-                ],
-                "target_audience": "adultos interesados en envejecimiento saludable",
-                "main_pain_points": [
-                    "pérdida de energía",
-                    "disminución de fuerza física",
-                    "problemas de memoria",
-                    "recuperación lenta",
-                    "preocupación por independencia futura"
-                ]
-            }
+        # Cualquier programa distinto de PRIME usa la configuración de LONGEVITY
+        return _PROGRAM_CONFIGS["PRIME"] if program_type == "PRIME" else _PROGRAM_CONFIGS["LONGEVITY"]
     
     def transition_to(self, new_phase: ConversationPhase) -> bool:
         """
@@ -129,33 +219,7 @@ class ConversationFlow:
         Returns:
             bool: True si la transición es válida, False si no
         """
-        # Definir transiciones válidas para cada fase
-        valid_transitions = {
-            ConversationPhase.GREETING: [
-                ConversationPhase.EXPLORATION,
-                ConversationPhase.OBJECTION_HANDLING
-            ],
-            ConversationPhase.EXPLORATION: [
-                ConversationPhase.PRESENTATION,
-                ConversationPhase.OBJECTION_HANDLING
-            ],
-            ConversationPhase.PRESENTATION: [
-                ConversationPhase.OBJECTION_HANDLING,
-                ConversationPhase.CLOSING
-            ],
-            ConversationPhase.OBJECTION_HANDLING: [
-                ConversationPhase.PRESENTATION,
-                ConversationPhase.CLOSING,
-                ConversationPhase.FOLLOW_UP
-            ],
-            ConversationPhase.CLOSING: [
-                ConversationPhase.OBJECTION_HANDLING,
-                ConversationPhase.FOLLOW_UP
-            ],
-            ConversationPhase.FOLLOW_UP: []  # No hay transiciones desde FOLLOW_UP (fase final)
-        }
-        
-        return target in valid_transitions[current]
+        return target in _VALID_TRANSITIONS[current]
     
     def detect_phase_from_text(self, text: str) -> ConversationPhase:
         """
@@ -167,50 +231,19 @@ class ConversationFlow:
         Returns:
             ConversationPhase: Fase detectada
         """
-        # Palabras clave que indican cada fase
-        phase_keywords = {
-            ConversationPhase.GREETING: [
-                "hola", "bienvenido", "gusto conocerte", "gracias por completar", 
-                "evaluación", "¿cómo estás?", "¿qué tal tu día?"
-            ],
-            ConversationPhase.EXPLORATION: [
-                "cuéntame más", "¿qué buscas?", "objetivos", "¿qué es importante para ti?",
-                "¿qué te gustaría mejorar?", "prioridades", "¿qué te motivó?"
-            ],
-            ConversationPhase.PRESENTATION: [
-                "nuestro programa", "te ofrecemos", "beneficios", "incluye", 
-                "está diseñado para", "funciona así", "consiste en"
-            ],
-            ConversationPhase.OBJECTION_HANDLING: [
-                "entiendo tu preocupación", "es un punto válido", "muchos se preguntan",
-                "respecto al precio", "en cuanto al tiempo", "garantía"
-            ],
-            ConversationPhase.CLOSING: [
-                "próximos pasos", "empezar", "iniciar", "agendar", "sesión inicial",
-                "reservar tu lugar", "proceso de inscripción"
-            ],
-            ConversationPhase.FOLLOW_UP: [
-                "ha sido un placer", "estaremos en contacto", "nos vemos pronto",
-                "te enviaré un correo", "hasta pronto", "cualquier duda"
-            ]
-        }
-        
-        # Contar ocurrencias de palabras clave por fase
+        # Contar ocurrencias de palabras clave por fase y quedarse con la de
+        # mayor puntuación en la misma pasada (en empate gana la primera fase)
         text_lower = text.lower()
-        phase_scores = {phase: 0 for phase in ConversationPhase}
-        
-        for phase, keywords in phase_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    phase_scores[phase] += 1
+        detected_phase = self.current_phase
+        best_score = 0
         
-        # Determinar la fase con mayor puntuación
-        detected_phase = max(phase_scores.items(), key=lambda x: x[1])[0]
+        for phase, keywords in _PHASE_KEYWORDS.items():
+            score = sum(1 for keyword in keywords if keyword in text_lower)
+            if score > best_score:
+                detected_phase = phase
+                best_score = score
         
-        # Si no hay una clara detección, mantener la fase actual
-        if phase_scores[detected_phase] == 0:
-            return self.current_phase
-            
+        # Si no hay una clara detección, se mantiene la fase actual
         return detected_phase
     
     def detect_objections(self, text: str) -> List[Objection]:
@@ -226,37 +259,11 @@ class ConversationFlow:
         text_lower = text.lower()
         detected = []
         
-        # Palabras clave que indican cada tipo de objeción
-        objection_keywords = {
-            Objection.PRICE: [
-                "caro", "costoso", "precio", "inversión", "pago", "presupuesto", "gasto"
-            ],
-            Objection.TIME: [
-                "tiempo", "ocupado", "agenda", "horario", "compromisos", "disponibilidad"
-            ],
-            Objection.VALUE: [
-                "vale la pena", "beneficio", "retorno", "inversión", "valor"
-            ],
-            Objection.RESULTS: [
-                "funciona", "resultados", "efectivo", "evidencia", "pruebas", "estudios"
-            ],
-            Objection.COMPETITION: [
-                "otra opción", "alternativa", "comparado", "diferencia", "competencia"
-            ],
-            Objection.DECISION_MAKER: [
-                "consultar", "esposo", "esposa", "pareja", "jefe", "pensar", "decidir"
-            ],
-            Objection.TIMING: [
-                "ahora no", "más adelante", "futuro", "momento", "después", "luego"
-            ]
-        }
-        
-        for objection_type, keywords in objection_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    detected.append(objection_type)
-                    self.detected_objections.add(objection_type)
-                    break  # Una coincidencia es suficiente por tipo
+        # Una coincidencia es suficiente por tipo: una búsqueda por tipo de objeción
+        for objection_type, pattern in _OBJECTION_PATTERNS.items():
+            if pattern.search(text_lower):
+                detected.append(objection_type)
+                self.detected_objections.add(objection_type)
         
         return detected
     
@@ -2,7 +2,7 @@ import os
 from dotenv import load_dotenv
 from supabase import create_client, Client
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from collections import defaultdict
 
 # Configurar logging
@@ -42,14 +42,17 @@ class MockSupabaseClient:
         self.tables[table_name].append(data)
         return data
 
-    def update(self, table_name: str, data: Dict[str, Any], filters: Optional[Dict[str, Any]] = None):
+    def update(self, table_name: str, data: Dict[str, Any], filters: Optional[List[Tuple[str, str, Any]]] = None):
         """Actualizar datos en la tabla simulada."""
         if not filters:
             return []
 
         updated = []
         for record in self.tables[table_name]:
-            match = all(record.get(k) == v for k, v in filters.items())
+            match = all(
+                record.get(field) in value if op == 'in' else record.get(field) == value
+                for field, op, value in filters
+            )
             if match:
                 record.update(data)
                 updated.append(record)
@@ -81,6 +84,11 @@ class MockTableQuery:
         self._filters.append((field, '=', value))
         return self
     
+    def in_(self, field, values):
+        """Simular filtro de pertenencia a una lista."""
+        self._filters.append((field, 'in', list(values)))
+        return self
+    
     def single(self):
         """Simular consulta que devuelve un único registro."""
         return self
@@ -94,8 +102,7 @@ class MockTableQuery:
             upserted = self.client.upsert(self.table_name, self._data)
             return {"data": [upserted]}
         elif self._operation == 'update':
-            filters = {f: v for f, _, v in self._filters}
-            updated = self.client.update(self.table_name, self._data, filters)
+            updated = self.client.update(self.table_name, self._data, self._filters)
             return {"data": updated}
         else:
             if not self._filters:
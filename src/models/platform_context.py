@@ -49,7 +49,7 @@ class ConversationMode(str, Enum):
     NURTURE = "nurture"
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformInfo:
     """
     Información sobre la plataforma desde donde se inicia la conversación.
@@ -66,7 +66,7 @@ class PlatformInfo:
     session_metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationConfig:
     """
     Configuración específica para una conversación basada en el contexto de plataforma.
@@ -90,7 +90,7 @@ class ConversationConfig:
     ab_test_group: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlatformContext:
     """
     Contexto completo de plataforma para una conversación.
@@ -195,6 +195,18 @@ class AdvancedSentimentService:
         # Extraer solo mensajes del usuario
         user_messages = [msg['content'] for msg in messages if msg.get('role') == 'user']
         
+        return self._analyze_user_sentiment_change(user_messages)
+    
+    def _analyze_user_sentiment_change(self, user_messages: List[str]) -> Dict[str, Any]:
+        """
+        Analiza el cambio de sentimiento sobre mensajes del usuario ya filtrados.
+        
+        Args:
+            user_messages: Contenido de los mensajes del usuario en orden cronológico
+            
+        Returns:
+            Dict: Análisis del cambio de sentimiento
+        """
         if len(user_messages) < 2:
             return {
                 "trend": "estable",
@@ -210,9 +222,70 @@ class AdvancedSentimentService:
             sentiment_scores.append(analysis['score'])
             
         # Calcular tendencia
-        initial_score = sentiment_scores[0]
-        final_score = sentiment_scores[-1]
+        changes = self.analyze_sentiment_changes(sentiment_scores)
+        initial_score = changes["initial_score"]
+        final_score = changes["final_score"]
+            
+        # Determinar sentimientos inicial y final
+        initial_sentiment = "positivo" if initial_score > 0.1 else "negativo" if initial_score < -0.1 else "neutral"
+        final_sentiment = "positivo" if final_score > 0.1 else "negativo" if final_score < -0.1 else "neutral"
+            
+        return {
+            "trend": changes["trend"],
+            "delta": changes["delta"],
+            "initial_sentiment": initial_sentiment,
+            "final_sentiment": final_sentiment,
+            "scores": sentiment_scores
+        }
+    
+    def analyze_sentiment_changes(self, sentiment_scores: List[float]) -> Dict[str, Any]:
+        """
+        Calcula las métricas de evolución de una serie de puntuaciones de sentimiento.
+        
+        Todas las agregaciones se obtienen en una sola pasada sobre un único array
+        de NumPy en lugar de recorrer la lista varias veces.
+        
+        Args:
+            sentiment_scores: Puntuaciones de sentimiento en orden cronológico
+            
+        Returns:
+            Dict: Tendencia, magnitud del cambio y estadísticas de la serie
+        """
+        if not sentiment_scores:
+            return {
+                "trend": "estable",
+                "delta": 0.0,
+                "magnitude": 0.0,
+                "initial_score": 0.0,
+                "final_score": 0.0,
+                "average": 0.0,
+                "variance": 0.0,
+                "positive_peaks": 0,
+                "negative_dips": 0,
+                "stability": 1.0
+            }
+        
+        # Con una sola puntuación no hay cambio: evitar construir el array
+        if len(sentiment_scores) == 1:
+            score = float(sentiment_scores[0])
+            return {
+                "trend": "estable",
+                "delta": 0.0,
+                "magnitude": 0.0,
+                "initial_score": score,
+                "final_score": score,
+                "average": score,
+                "variance": 0.0,
+                "positive_peaks": int(score > 0.1),
+                "negative_dips": int(score < -0.1),
+                "stability": 1.0
+            }
+        
+        scores = np.asarray(sentiment_scores, dtype=np.float64)
+        initial_score = float(scores[0])
+        final_score = float(scores[-1])
         delta = final_score - initial_score
+        variance = float(scores.var())
         
         # Determinar tendencia
         if delta > 0.2:
@@ -221,17 +294,18 @@ class AdvancedSentimentService:
             trend = "empeorando"
         else:
             trend = "estable"
-            
-        # Determinar sentimientos inicial y final
-        initial_sentiment = "positivo" if initial_score > 0.1 else "negativo" if initial_score < -0.1 else "neutral"
-        final_sentiment = "positivo" if final_score > 0.1 else "negativo" if final_score < -0.1 else "neutral"
-            
+        
         return {
             "trend": trend,
             "delta": delta,
-            "initial_sentiment": initial_sentiment,
-            "final_sentiment": final_sentiment,
-            "scores": sentiment_scores
+            "magnitude": abs(delta),
+            "initial_score": initial_score,
+            "final_score": final_score,
+            "average": float(scores.mean()),
+            "variance": variance,
+            "positive_peaks": int((scores > 0.1).sum()),
+            "negative_dips": int((scores < -0.1).sum()),
+            "stability": 1.0 / (1.0 + variance)
         }
     
     def detect_urgency(self, text: str) -> Dict[str, Any]:
@@ -362,8 +436,8 @@ class AdvancedSentimentService:
         # Análisis completo del texto combinado
         comprehensive = self.get_comprehensive_analysis(all_text)
         
-        # Análisis de cambio de sentimiento
-        sentiment_change = self.analyze_sentiment_change(messages)
+        # Análisis de cambio de sentimiento (reutiliza los mensajes ya filtrados)
+        sentiment_change = self._analyze_user_sentiment_change(user_messages)
         
         return {
             "overall_sentiment": comprehensive["sentiment"]["sentiment"],
@@ -78,11 +78,16 @@ class ConversationAnalyticsService:
             
             # Calcular métricas básicas
             total_messages = len(messages)
-            user_messages = [msg for msg in messages if msg.get("role") == "user"]
-            assistant_messages = [msg for msg in messages if msg.get("role") == "assistant"]
             
-            user_message_count = len(user_messages)
-            assistant_message_count = len(assistant_messages)
+            # Contar mensajes por rol en una sola pasada
+            user_message_count = 0
+            assistant_message_count = 0
+            for msg in messages:
+                role = msg.get("role")
+                if role == "user":
+                    user_message_count += 1
+                elif role == "assistant":
+                    assistant_message_count += 1
             
             # Calcular duración de la conversación
             start_time = None
@@ -228,23 +233,25 @@ class ConversationAnalyticsService:
                 session_insights = conv.get("session_insights", {})
                 
                 # Extraer sentimiento
-                if "intent_analysis" in session_insights:
-                    sentiment_score = session_insights["intent_analysis"].get("sentiment_score")
+                intent_analysis = session_insights.get("intent_analysis")
+                if intent_analysis is not None:
+                    sentiment_score = intent_analysis.get("sentiment_score")
                     if sentiment_score is not None:
                         sentiment_scores.append(sentiment_score)
                 
+                # Resolver el análisis NLP una sola vez para intenciones y entidades
+                nlp_analysis = session_insights.get("nlp_analysis") or {}
+                
                 # Extraer intenciones
-                if "nlp_analysis" in session_insights and "intent" in session_insights["nlp_analysis"]:
-                    for intent, score in session_insights["nlp_analysis"]["intent"].items():
+                if "intent" in nlp_analysis:
+                    for intent, score in nlp_analysis["intent"].items():
                         if score > 0.5:  # Solo contar intenciones relevantes
                             intents[intent] = intents.get(intent, 0) + 1
                 
                 # Extraer entidades
-                if "nlp_analysis" in session_insights and "entities" in session_insights["nlp_analysis"]:
-                    for entity_type, entity_list in session_insights["nlp_analysis"]["entities"].items():
-                        if entity_type not in entities:
-                            entities[entity_type] = []
-                        entities[entity_type].extend(entity_list)
+                if "entities" in nlp_analysis:
+                    for entity_type, entity_list in nlp_analysis["entities"].items():
+                        entities.setdefault(entity_type, []).extend(entity_list)
                 
                 # Procesar alertas
                 conv_id = conv.get("conversation_id")
@@ -311,13 +318,14 @@ class ConversationAnalyticsService:
                 # Obtener top 5 entidades más frecuentes
                 top_entities[entity_type] = sorted(entity_counts.items(), key=lambda x: x[1], reverse=True)[:5]
             
-            # Construir análisis agregado
+            # Construir análisis agregado (una sola marca de tiempo para fin y generación)
+            now_iso = datetime.now().isoformat()
             aggregate_analytics = {
                 "has_analytics": True,
                 "time_period": {
                     "days": days,
                     "start_date": start_date.isoformat(),
-                    "end_date": datetime.now().isoformat()
+                    "end_date": now_iso
                 },
                 "conversation_metrics": {
                     "total_conversations": total_conversations,
@@ -340,7 +348,7 @@ class ConversationAnalyticsService:
                     "total_recommendations": sum(recommendations_by_type.values()),
                     "recommendations_by_type": recommendations_by_type
                 },
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso
             }
             
             return aggregate_analytics
@@ -433,18 +441,19 @@ class ConversationAnalyticsService:
             sentiment_series = [{"date": day, "score": avg_sentiment_by_day[day]} for day in sorted_days]
             alert_series = [{"date": day, "count": alerts_by_day[day]} for day in sorted_days]
             
-            # Construir análisis de tendencias
+            # Construir análisis de tendencias (una sola marca de tiempo para fin y generación)
+            now_iso = datetime.now().isoformat()
             trend_analysis = {
                 "has_analytics": True,
                 "time_period": {
                     "days": days,
                     "start_date": start_date.isoformat(),
-                    "end_date": datetime.now().isoformat()
+                    "end_date": now_iso
                 },
                 "conversation_trend": conversation_series,
                 "sentiment_trend": sentiment_series,
                 "alert_trend": alert_series,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso
             }
             
             return trend_analysis
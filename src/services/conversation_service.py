@@ -6,6 +6,7 @@ from typing import Optional, Dict, Any, Tuple, List
 from io import BytesIO
 from datetime import datetime
 import uuid
+from dataclasses import asdict
 
 # Importar nuevos sistemas de plataforma
 from src.models.conversation import ConversationState, CustomerData, Message
@@ -643,7 +644,7 @@ class ConversationService:
                     for msg in state.messages[-5:]  # Últimos 5 mensajes para contexto
                 ],
                 "platform_info": self.platform_context.platform_info.to_dict() if self.platform_context else {},
-                "conversation_config": self.platform_context.conversation_config.__dict__ if self.platform_context else {}
+                "conversation_config": asdict(self.platform_context.conversation_config) if self.platform_context else {}
             }
             
             # Procesar mensaje con el agente
@@ -24,6 +24,20 @@ from src.services.conversion_prediction_service import ConversionPredictionServi
 
 logger = logging.getLogger(__name__)
 
+# Pesos de objetivos por defecto del modelo (compartidos; tratar como solo lectura)
+_DEFAULT_OBJECTIVE_WEIGHTS = {
+    "need_satisfaction": 0.35,
+    "objection_handling": 0.25,
+    "conversion_progress": 0.4
+}
+
+# Pesos de respaldo cuando no hay parámetros del modelo o falla la priorización
+_FALLBACK_OBJECTIVE_WEIGHTS = {
+    "conversion": 0.4,
+    "need_satisfaction": 0.35,
+    "objection_handling": 0.25
+}
+
 class DecisionEngineService(BasePredictiveService):
     """
     Servicio para optimizar el flujo de conversación y toma de decisiones.
@@ -70,11 +84,7 @@ class DecisionEngineService(BasePredictiveService):
         Inicializa el modelo del motor de decisiones.
         """
         model_params = {
-            "objective_weights": {
-                "need_satisfaction": 0.35,
-                "objection_handling": 0.25,
-                "conversion_progress": 0.4
-            },
+            "objective_weights": dict(_DEFAULT_OBJECTIVE_WEIGHTS),
             "exploration_rate": 0.2,  # Tasa de exploración para nuevas rutas
             "adaptation_threshold": 0.3,  # Umbral para adaptación de estrategia
             "max_tree_depth": 5,  # Profundidad máxima de árboles de decisión
@@ -116,11 +126,7 @@ class DecisionEngineService(BasePredictiveService):
             min_confidence = model_params.get("min_confidence", 0.6)
             
             # Obtener objetivos predeterminados si no se proporcionan
-            objective_weights = current_objectives or model_params.get("objective_weights", {
-                "need_satisfaction": 0.35,
-                "objection_handling": 0.25,
-                "conversion_progress": 0.4
-            })
+            objective_weights = current_objectives or model_params.get("objective_weights", _DEFAULT_OBJECTIVE_WEIGHTS)
             
             # Obtener predicciones de otros servicios en paralelo para mejorar rendimiento
             objection_task = self.objection_service.predict_objections(
@@ -840,21 +846,12 @@ class DecisionEngineService(BasePredictiveService):
             # Obtener parámetros del modelo usando el método de la clase base
             model_params = await self.get_model_parameters()
             if not model_params:
-                default_weights = {
-                    "conversion": 0.4,
-                    "need_satisfaction": 0.35,
-                    "objection_handling": 0.25
-                }
-                return default_weights
-            default_weights = model_params.get("objective_weights", {
-                "need_satisfaction": 0.35,
-                "objection_handling": 0.25,
-                "conversion_progress": 0.4
-            })
+                return dict(_FALLBACK_OBJECTIVE_WEIGHTS)
+            default_weights = model_params.get("objective_weights", _DEFAULT_OBJECTIVE_WEIGHTS)
             
-            # Si no hay mensajes, usar pesos predeterminados
+            # Si no hay mensajes, usar pesos predeterminados (copia: el llamador puede modificarlos)
             if not messages:
-                return default_weights
+                return dict(default_weights)
             
             # Obtener predicciones para evaluar prioridades
             objection_prediction = await self.objection_service.predict_objections(
@@ -917,11 +914,7 @@ class DecisionEngineService(BasePredictiveService):
             
         except Exception as e:
             logger.error(f"Error al priorizar objetivos: {e}")
-            return {
-                "conversion": 0.4,
-                "need_satisfaction": 0.35,
-                "objection_handling": 0.25
-            }
+            return dict(_FALLBACK_OBJECTIVE_WEIGHTS)
     
     async def evaluate_conversation_path(self, conversation_id: str,
                                     messages: List[Dict[str, Any]],
@@ -13,6 +13,7 @@ import numpy as np
 from collections import Counter
 
 from src.integrations.supabase import resilient_supabase_client
+from src.services.utils.signal_detection import compile_keyword_pattern
 
 # Configurar logging
 logger = logging.getLogger(__name__)
@@ -269,13 +270,17 @@ class EnhancedIntentAnalysisService:
         # Analizar los últimos 3 mensajes del usuario (o todos si hay menos)
         recent_messages = user_messages[-3:]
         
+        # Pasar a minúsculas una sola vez, no por cada palabra clave
+        recent_lower = [msg.lower() for msg in recent_messages]
+        
         # Calcular indicadores de intención de compra con pesos personalizados
         intent_indicators = []
         intent_scores = []
         
         for keyword in self.intent_model['intent_keywords']:
-            for msg in recent_messages:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', msg.lower()):
+            pattern = compile_keyword_pattern(keyword)
+            for msg in recent_lower:
+                if pattern.search(msg):
                     weight = self.intent_model['keyword_weights'].get(keyword, 1.0)
                     intent_indicators.append(keyword)
                     intent_scores.append(weight)
@@ -284,8 +289,8 @@ class EnhancedIntentAnalysisService:
         # Calcular indicadores de rechazo
         rejection_indicators = []
         for phrase in self.intent_model['rejection_keywords']:
-            for msg in recent_messages:
-                if phrase in msg.lower():
+            for msg in recent_lower:
+                if phrase in msg:
                     rejection_indicators.append(phrase)
                     break
         
@@ -293,11 +298,9 @@ class EnhancedIntentAnalysisService:
         intent_indicators = list(set(intent_indicators))
         rejection_indicators = list(set(rejection_indicators))
         
-        # Análisis de sentimiento
-        sentiment_score = await self._analyze_sentiment(recent_messages)
-        
-        # Análisis de engagement
-        engagement_score = await self._analyze_engagement(recent_messages)
+        # Análisis de sentimiento y engagement (cálculo puramente en CPU, síncrono)
+        sentiment_score = self._analyze_sentiment(recent_messages)
+        engagement_score = self._analyze_engagement(recent_messages)
         
         # Calcular probabilidad de compra
         intent_score = sum(intent_scores) * 0.15  # Cada indicador suma según su peso
@@ -333,7 +336,7 @@ class EnhancedIntentAnalysisService:
         
         return result
     
-    async def _analyze_sentiment(self, messages: List[str]) -> float:
+    def _analyze_sentiment(self, messages: List[str]) -> float:
         """
         Analiza el sentimiento en los mensajes del usuario.
         
@@ -368,7 +371,7 @@ class EnhancedIntentAnalysisService:
         
         return (positive_count - negative_count) / total_indicators
     
-    async def _analyze_engagement(self, messages: List[str]) -> float:
+    def _analyze_engagement(self, messages: List[str]) -> float:
         """
         Analiza el nivel de engagement del usuario basado en la longitud de los mensajes,
         uso de preguntas, etc.
@@ -382,12 +385,19 @@ class EnhancedIntentAnalysisService:
         if not messages:
             return 0.0
         
+        # Acumular longitud total y número de preguntas en una sola pasada
+        total_length = 0
+        question_count = 0
+        for msg in messages:
+            total_length += len(msg)
+            if '?' in msg:
+                question_count += 1  # Las preguntas indican interés
+        
         # Calcular longitud promedio de mensajes
-        avg_length = sum(len(msg) for msg in messages) / len(messages)
+        avg_length = total_length / len(messages)
         length_score = min(1.0, avg_length / 200)  # Normalizar a 0-1
         
-        # Contar preguntas (indicador de interés)
-        question_count = sum(1 for msg in messages if '?' in msg)
+        # Proporción de preguntas
         question_ratio = question_count / len(messages)
         
         # Penalizar si hay demasiadas preguntas (podría indicar confusión)
@@ -456,11 +466,14 @@ class EnhancedIntentAnalysisService:
                 logger.warning(f"No hay mensajes de usuario para actualizar el modelo de {conversation_id}")
                 return False
             
+            # Pasar a minúsculas una sola vez para tokenizar y buscar palabras clave
+            user_messages_lower = [msg.lower() for msg in user_messages]
+            
             # Analizar palabras y frases en los mensajes
             all_words = []
-            for msg in user_messages:
+            for msg in user_messages_lower:
                 # Tokenizar mensaje en palabras
-                words = re.findall(r'\b\w+\b', msg.lower())
+                words = re.findall(r'\b\w+\b', msg)
                 all_words.extend(words)
             
             # Contar frecuencia de palabras
@@ -475,7 +488,7 @@ class EnhancedIntentAnalysisService:
             # Actualizar pesos de palabras clave existentes
             for keyword in self.intent_model['intent_keywords']:
                 # Si la palabra clave aparece en la conversación
-                if any(keyword in msg.lower() for msg in user_messages):
+                if any(keyword in msg for msg in user_messages_lower):
                     current_weight = keyword_weights.get(keyword, 1.0)
                     # Ajustar peso según resultado de conversión
                     new_weight = max(0.1, min(2.0, current_weight + adjustment_factor))
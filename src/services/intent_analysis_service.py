@@ -3,10 +3,11 @@ Servicio para analizar la intención de compra en conversaciones.
 """
 
 import logging
-import re
 from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime
 
+from src.services.utils.signal_detection import compile_keyword_pattern
+
 # Configurar logging
 logger = logging.getLogger(__name__)
 
@@ -62,19 +63,23 @@ class IntentAnalysisService:
         # Analizar los últimos 3 mensajes del usuario (o todos si hay menos)
         recent_messages = user_messages[-3:]
         
+        # Pasar a minúsculas una sola vez, no por cada palabra clave
+        recent_lower = [msg.lower() for msg in recent_messages]
+        
         # Calcular indicadores de intención de compra
         intent_indicators = []
         for keyword in self.PURCHASE_INTENT_KEYWORDS:
-            for msg in recent_messages:
-                if re.search(r'\b' + re.escape(keyword) + r'\b', msg.lower()):
+            pattern = compile_keyword_pattern(keyword)
+            for msg in recent_lower:
+                if pattern.search(msg):
                     intent_indicators.append(keyword)
                     break
         
         # Calcular indicadores de rechazo
         rejection_indicators = []
         for phrase in self.REJECTION_KEYWORDS:
-            for msg in recent_messages:
-                if phrase in msg.lower():
+            for msg in recent_lower:
+                if phrase in msg:
                     rejection_indicators.append(phrase)
                     break
         
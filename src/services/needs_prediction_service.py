@@ -23,6 +23,118 @@ from src.services.utils.data_processing import extract_features_from_conversatio
 
 logger = logging.getLogger(__name__)
 
+# Ajustes específicos por industria
+_INDUSTRY_ADJUSTMENTS = {
+    "healthcare": {"technical_details": 0.2, "compliance": 0.3, "security": 0.3},
+    "finance": {"security": 0.3, "compliance": 0.3, "technical_details": 0.2},
+    "education": {"training": 0.3, "support": 0.2, "pricing": 0.2},
+    "retail": {"integration": 0.2, "customization": 0.2},
+    "technology": {"technical_details": 0.3, "integration": 0.3, "features": 0.2}
+}
+
+# Biblioteca de acciones sugeridas por categoría
+_ACTIONS_BY_CATEGORY = {
+    "information": [
+        {"type": "content", "action": "Compartir folleto informativo general", "priority": "high"},
+        {"type": "content", "action": "Enviar enlace a página de información detallada", "priority": "medium"},
+        {"type": "conversation", "action": "Preguntar qué aspectos específicos le interesan más", "priority": "high"}
+    ],
+    "pricing": [
+        {"type": "content", "action": "Compartir lista de precios", "priority": "high"},
+        {"type": "content", "action": "Enviar comparativa de planes", "priority": "medium"},
+        {"type": "conversation", "action": "Preguntar sobre presupuesto disponible", "priority": "medium"},
+        {"type": "offer", "action": "Ofrecer descuento por tiempo limitado", "priority": "low"}
+    ],
+    "features": [
+        {"type": "content", "action": "Compartir lista de características principales", "priority": "high"},
+        {"type": "demo", "action": "Ofrecer demostración de producto", "priority": "high"},
+        {"type": "conversation", "action": "Preguntar qué funcionalidades son más importantes", "priority": "medium"}
+    ],
+    "support": [
+        {"type": "content", "action": "Compartir detalles de planes de soporte", "priority": "high"},
+        {"type": "conversation", "action": "Preguntar sobre necesidades específicas de soporte", "priority": "medium"},
+        {"type": "contact", "action": "Ofrecer contacto con equipo de soporte", "priority": "medium"}
+    ],
+    "customization": [
+        {"type": "content", "action": "Compartir opciones de personalización", "priority": "high"},
+        {"type": "conversation", "action": "Preguntar sobre requisitos específicos de personalización", "priority": "high"},
+        {"type": "contact", "action": "Programar llamada con consultor de soluciones", "priority": "medium"}
+    ],
+    "integration": [
+        {"type": "content", "action": "Compartir lista de integraciones disponibles", "priority": "high"},
+        {"type": "conversation", "action": "Preguntar sobre sistemas actuales", "priority": "high"},
+        {"type": "content", "action": "Enviar documentación técnica de APIs", "priority": "medium"}
+    ],
+    "training": [
+        {"type": "content", "action": "Compartir opciones de capacitación", "priority": "high"},
+        {"type": "content", "action": "Enviar enlace a recursos de aprendizaje", "priority": "medium"},
+        {"type": "conversation", "action": "Preguntar sobre necesidades específicas de formación", "priority": "medium"}
+    ],
+    "comparison": [
+        {"type": "content", "action": "Compartir tabla comparativa con competidores", "priority": "high"},
+        {"type": "conversation", "action": "Preguntar qué otras soluciones está considerando", "priority": "high"},
+        {"type": "content", "action": "Destacar ventajas competitivas", "priority": "medium"}
+    ],
+    "technical_details": [
+        {"type": "content", "action": "Compartir especificaciones técnicas", "priority": "high"},
+        {"type": "contact", "action": "Ofrecer consulta con especialista técnico", "priority": "medium"},
+        {"type": "content", "action": "Enviar documentación de arquitectura", "priority": "medium"}
+    ],
+    "case_studies": [
+        {"type": "content", "action": "Compartir casos de éxito relevantes", "priority": "high"},
+        {"type": "content", "action": "Enviar testimonios de clientes", "priority": "medium"},
+        {"type": "conversation", "action": "Ofrecer referencias de clientes similares", "priority": "medium"}
+    ],
+    "alternatives": [
+        {"type": "conversation", "action": "Preguntar qué está buscando en una solución", "priority": "high"},
+        {"type": "content", "action": "Presentar diferentes opciones de producto", "priority": "high"},
+        {"type": "content", "action": "Compartir comparativa de planes/versiones", "priority": "medium"}
+    ]
+}
+
+# Acciones adicionales por industria
+_INDUSTRY_SPECIFIC_ACTIONS = {
+    "healthcare": [
+        {"type": "content", "action": "Compartir caso de éxito en sector salud", "priority": "high"},
+        {"type": "content", "action": "Enviar información sobre cumplimiento normativo en salud", "priority": "high"}
+    ],
+    "finance": [
+        {"type": "content", "action": "Compartir caso de éxito en sector financiero", "priority": "high"},
+        {"type": "content", "action": "Enviar información sobre seguridad y cumplimiento", "priority": "high"}
+    ],
+    "education": [
+        {"type": "content", "action": "Compartir caso de éxito en sector educativo", "priority": "high"},
+        {"type": "content", "action": "Enviar información sobre planes para instituciones educativas", "priority": "high"}
+    ],
+    "retail": [
+        {"type": "content", "action": "Compartir caso de éxito en retail", "priority": "high"},
+        {"type": "content", "action": "Enviar información sobre integración con sistemas de punto de venta", "priority": "high"}
+    ],
+    "technology": [
+        {"type": "content", "action": "Compartir documentación técnica avanzada", "priority": "high"},
+        {"type": "content", "action": "Enviar información sobre APIs y extensibilidad", "priority": "high"}
+    ]
+}
+
+# Acciones adicionales por tamaño de empresa
+_SIZE_SPECIFIC_ACTIONS = {
+    "small": [
+        {"type": "content", "action": "Compartir planes para pequeñas empresas", "priority": "high"},
+        {"type": "offer", "action": "Ofrecer paquete inicial con descuento", "priority": "medium"}
+    ],
+    "medium": [
+        {"type": "content", "action": "Compartir planes para empresas medianas", "priority": "high"},
+        {"type": "contact", "action": "Ofrecer consultoría de implementación", "priority": "medium"}
+    ],
+    "large": [
+        {"type": "content", "action": "Compartir planes empresariales", "priority": "high"},
+        {"type": "contact", "action": "Ofrecer gestor de cuenta dedicado", "priority": "high"}
+    ]
+}
+
+# Orden de prioridad para las acciones sugeridas
+_PRIORITY_VALUES = {"high": 3, "medium": 2, "low": 1}
+
 class NeedsPredictionService(BasePredictiveService):
     """
     Servicio para anticipar las necesidades de los clientes.
@@ -299,18 +411,9 @@ class NeedsPredictionService(BasePredictiveService):
         if customer_profile:
             industry = customer_profile.get("industry")
             
-            # Ajustes específicos por industria
-            industry_adjustments = {
-                "healthcare": {"technical_details": 0.2, "compliance": 0.3, "security": 0.3},
-                "finance": {"security": 0.3, "compliance": 0.3, "technical_details": 0.2},
-                "education": {"training": 0.3, "support": 0.2, "pricing": 0.2},
-                "retail": {"integration": 0.2, "customization": 0.2},
-                "technology": {"technical_details": 0.3, "integration": 0.3, "features": 0.2}
-            }
-            
             # Aplicar ajustes por industria
-            if industry and industry in industry_adjustments:
-                for category, adjustment in industry_adjustments[industry].items():
+            if industry and industry in _INDUSTRY_ADJUSTMENTS:
+                for category, adjustment in _INDUSTRY_ADJUSTMENTS[industry].items():
                     if category in need_scores:
                         need_scores[category] += adjustment * feature_weights.get("similar_profiles", 0.25)
         
@@ -334,68 +437,8 @@ class NeedsPredictionService(BasePredictiveService):
         Returns:
             Lista de acciones sugeridas
         """
-        # Biblioteca de acciones sugeridas por categoría
-        actions_by_category = {
-            "information": [
-                {"type": "content", "action": "Compartir folleto informativo general", "priority": "high"},
-                {"type": "content", "action": "Enviar enlace a página de información detallada", "priority": "medium"},
-                {"type": "conversation", "action": "Preguntar qué aspectos específicos le interesan más", "priority": "high"}
-            ],
-            "pricing": [
-                {"type": "content", "action": "Compartir lista de precios", "priority": "high"},
-                {"type": "content", "action": "Enviar comparativa de planes", "priority": "medium"},
-                {"type": "conversation", "action": "Preguntar sobre presupuesto disponible", "priority": "medium"},
-                {"type": "offer", "action": "Ofrecer descuento por tiempo limitado", "priority": "low"}
-            ],
-            "features": [
-                {"type": "content", "action": "Compartir lista de características principales", "priority": "high"},
-                {"type": "demo", "action": "Ofrecer demostración de producto", "priority": "high"},
-                {"type": "conversation", "action": "Preguntar qué funcionalidades son más importantes", "priority": "medium"}
-            ],
-            "support": [
-                {"type": "content", "action": "Compartir detalles de planes de soporte", "priority": "high"},
-                {"type": "conversation", "action": "Preguntar sobre necesidades específicas de soporte", "priority": "medium"},
-                {"type": "contact", "action": "Ofrecer contacto con equipo de soporte", "priority": "medium"}
-            ],
-            "customization": [
-                {"type": "content", "action": "Compartir opciones de personalización", "priority": "high"},
-                {"type": "conversation", "action": "Preguntar sobre requisitos específicos de personalización", "priority": "high"},
-                {"type": "contact", "action": "Programar llamada con consultor de soluciones", "priority": "medium"}
-            ],
-            "integration": [
-                {"type": "content", "action": "Compartir lista de integraciones disponibles", "priority": "high"},
-                {"type": "conversation", "action": "Preguntar sobre sistemas actuales", "priority": "high"},
-                {"type": "content", "action": "Enviar documentación técnica de APIs", "priority": "medium"}
-            ],
-            "training": [
-                {"type": "content", "action": "Compartir opciones de capacitación", "priority": "high"},
-                {"type": "content", "action": "Enviar enlace a recursos de aprendizaje", "priority": "medium"},
-                {"type": "conversation", "action": "Preguntar sobre necesidades específicas de formación", "priority": "medium"}
-            ],
-            "comparison": [
-                {"type": "content", "action": "Compartir tabla comparativa con competidores", "priority": "high"},
-                {"type": "conversation", "action": "Preguntar qué otras soluciones está considerando", "priority": "high"},
-                {"type": "content", "action": "Destacar ventajas competitivas", "priority": "medium"}
-            ],
-            "technical_details": [
-                {"type": "content", "action": "Compartir especificaciones técnicas", "priority": "high"},
-                {"type": "contact", "action": "Ofrecer consulta con especialista técnico", "priority": "medium"},
-                {"type": "content", "action": "Enviar documentación de arquitectura", "priority": "medium"}
-            ],
-            "case_studies": [
-                {"type": "content", "action": "Compartir casos de éxito relevantes", "priority": "high"},
-                {"type": "content", "action": "Enviar testimonios de clientes", "priority": "medium"},
-                {"type": "conversation", "action": "Ofrecer referencias de clientes similares", "priority": "medium"}
-            ],
-            "alternatives": [
-                {"type": "conversation", "action": "Preguntar qué está buscando en una solución", "priority": "high"},
-                {"type": "content", "action": "Presentar diferentes opciones de producto", "priority": "high"},
-                {"type": "content", "action": "Compartir comparativa de planes/versiones", "priority": "medium"}
-            ]
-        }
-        
-        # Obtener acciones base para la categoría
-        suggested_actions = actions_by_category.get(need_category, [])
+        # Obtener acciones base para la categoría (copias, las plantillas son compartidas)
+        suggested_actions = [dict(action) for action in _ACTIONS_BY_CATEGORY.get(need_category, ())]
         
         # Personalizar acciones según el perfil del cliente (si está disponible)
         if customer_profile:
@@ -404,55 +447,16 @@ class NeedsPredictionService(BasePredictiveService):
             
             # Ajustes específicos por industria
             if industry:
-                industry_specific_actions = {
-                    "healthcare": [
-                        {"type": "content", "action": f"Compartir caso de éxito en sector salud", "priority": "high"},
-                        {"type": "content", "action": f"Enviar información sobre cumplimiento normativo en salud", "priority": "high"}
-                    ],
-                    "finance": [
-                        {"type": "content", "action": f"Compartir caso de éxito en sector financiero", "priority": "high"},
-                        {"type": "content", "action": f"Enviar información sobre seguridad y cumplimiento", "priority": "high"}
-                    ],
-                    "education": [
-                        {"type": "content", "action": f"Compartir caso de éxito en sector educativo", "priority": "high"},
-                        {"type": "content", "action": f"Enviar información sobre planes para instituciones educativas", "priority": "high"}
-                    ],
-                    "retail": [
-                        {"type": "content", "action": f"Compartir caso de éxito en retail", "priority": "high"},
-                        {"type": "content", "action": f"Enviar información sobre integración con sistemas de punto de venta", "priority": "high"}
-                    ],
-                    "technology": [
-                        {"type": "content", "action": f"Compartir documentación técnica avanzada", "priority": "high"},
-                        {"type": "content", "action": f"Enviar información sobre APIs y extensibilidad", "priority": "high"}
-                    ]
-                }
-                
-                if industry in industry_specific_actions:
-                    suggested_actions.extend(industry_specific_actions[industry])
+                if industry in _INDUSTRY_SPECIFIC_ACTIONS:
+                    suggested_actions.extend(dict(action) for action in _INDUSTRY_SPECIFIC_ACTIONS[industry])
             
             # Ajustes por tamaño de empresa
             if company_size:
-                size_specific_actions = {
-                    "small": [
-                        {"type": "content", "action": "Compartir planes para pequeñas empresas", "priority": "high"},
-                        {"type": "offer", "action": "Ofrecer paquete inicial con descuento", "priority": "medium"}
-                    ],
-                    "medium": [
-                        {"type": "content", "action": "Compartir planes para empresas medianas", "priority": "high"},
-                        {"type": "contact", "action": "Ofrecer consultoría de implementación", "priority": "medium"}
-                    ],
-                    "large": [
-                        {"type": "content", "action": "Compartir planes empresariales", "priority": "high"},
-                        {"type": "contact", "action": "Ofrecer gestor de cuenta dedicado", "priority": "high"}
-                    ]
-                }
-                
-                if company_size in size_specific_actions:
-                    suggested_actions.extend(size_specific_actions[company_size])
+                if company_size in _SIZE_SPECIFIC_ACTIONS:
+                    suggested_actions.extend(dict(action) for action in _SIZE_SPECIFIC_ACTIONS[company_size])
         
         # Ordenar por prioridad
-        priority_values = {"high": 3, "medium": 2, "low": 1}
-        suggested_actions.sort(key=lambda x: priority_values.get(x.get("priority"), 0), reverse=True)
+        suggested_actions.sort(key=lambda x: _PRIORITY_VALUES.get(x.get("priority"), 0), reverse=True)
         
         return suggested_actions
     
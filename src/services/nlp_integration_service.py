@@ -15,6 +15,17 @@ from src.services.keyword_extraction_service import KeywordExtractionService
 # Configurar logging
 logger = logging.getLogger(__name__)
 
+# Fase de la conversación asociada a cada intención predominante
+# (cualquier otra intención se considera "exploración")
+_INTENT_CONVERSATION_PHASES = {
+    "transacción_compra": "decisión",
+    "transacción_pago": "decisión",
+    "soporte_técnico": "resolución",
+    "soporte_cuenta": "resolución",
+    "queja_servicio": "insatisfacción",
+    "queja_producto": "insatisfacción"
+}
+
 class NLPIntegrationService:
     """
     Servicio que integra todas las capacidades avanzadas de NLP.
@@ -272,12 +283,7 @@ class NLPIntegrationService:
         conversation_phase = "exploración"
         if "intent" in analysis and "predominant_intent" in analysis["intent"]:
             intent = analysis["intent"]["predominant_intent"]
-            if intent in ["transacción_compra", "transacción_pago"]:
-                conversation_phase = "decisión"
-            elif intent in ["soporte_técnico", "soporte_cuenta"]:
-                conversation_phase = "resolución"
-            elif intent in ["queja_servicio", "queja_producto"]:
-                conversation_phase = "insatisfacción"
+            conversation_phase = _INTENT_CONVERSATION_PHASES.get(intent, conversation_phase)
         
         # Nivel de compromiso
         engagement = "medio"
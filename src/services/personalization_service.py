@@ -3,6 +3,7 @@ Servicio para personalizar la comunicación según el perfil del usuario.
 """
 
 import logging
+import re
 from typing import Dict, Any, Optional, List
 
 # Configurar logging
@@ -46,6 +47,11 @@ class PersonalizationService:
         }
     }
     
+    # Ocupaciones que sugieren un perfil de comunicación técnico
+    TECHNICAL_OCCUPATIONS = ['ingeniero', 'programador', 'desarrollador', 'científico', 
+                             'investigador', 'médico', 'técnico', 'analista']
+    TECHNICAL_OCCUPATIONS_PATTERN = re.compile('|'.join(map(re.escape, TECHNICAL_OCCUPATIONS)))
+    
     def __init__(self):
         """Inicializar el servicio de personalización."""
         logger.info("Servicio de personalización inicializado")
@@ -78,13 +84,9 @@ class PersonalizationService:
             # Jóvenes suelen preferir comunicación más casual y entusiasta
             return 'enthusiastic'
         
-        # Determinar por ocupación
-        technical_occupations = ['ingeniero', 'programador', 'desarrollador', 'científico', 
-                               'investigador', 'médico', 'técnico', 'analista']
-        
-        for tech_occ in technical_occupations:
-            if tech_occ in occupation:
-                return 'technical'
+        # Determinar por ocupación (una sola búsqueda sobre el patrón precompilado)
+        if self.TECHNICAL_OCCUPATIONS_PATTERN.search(occupation):
+            return 'technical'
         
         # Por defecto, usar casual para la mayoría de los usuarios
         return 'casual'
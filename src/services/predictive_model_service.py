@@ -9,7 +9,7 @@ y predicción de probabilidad de conversión.
 from typing import Dict, List, Any, Optional, Tuple
 import logging
 import json
-import numpy as np
+import math
 from datetime import datetime, timedelta
 
 from src.integrations.supabase.resilient_client import ResilientSupabaseClient
@@ -52,7 +52,8 @@ class PredictiveModelService:
             
             actual_supabase_client = self.supabase._base_client.get_client()
             for table in tables:
-                result = actual_supabase_client.table(table).select("*", count="exact").execute()
+                # Basta con el conteo exacto: limitar a una fila evita descargar la tabla completa
+                result = actual_supabase_client.table(table).select("*", count="exact").limit(1).execute()
                 logger.info(f"Tabla {table} verificada: {result}")
                 
         except Exception as e:
@@ -293,8 +294,15 @@ class PredictiveModelService:
             
             predictions = result.data
             total = len(predictions)
-            correct = sum(1 for p in predictions if p.get("was_correct", False))
-            confidence_avg = sum(p.get("confidence", 0) for p in predictions) / total if total > 0 else 0
+            
+            # Contar aciertos y acumular confianza en una sola pasada
+            correct = 0
+            confidence_sum = 0
+            for p in predictions:
+                if p.get("was_correct", False):
+                    correct += 1
+                confidence_sum += p.get("confidence", 0)
+            confidence_avg = confidence_sum / total if total > 0 else 0
             
             accuracy = correct / total if total > 0 else 0
             
@@ -392,9 +400,12 @@ class PredictiveModelService:
         Returns:
             True si se actualizaron correctamente, False en caso contrario
         """
+        if not data_ids:
+            return True
+            
         try:
-            for data_id in data_ids:
-                self.supabase.table("model_training_data").update({"used_in_training": True}).eq("id", data_id).execute()
+            # Una sola actualización por lote en lugar de una consulta por ID
+            self.supabase.table("model_training_data").update({"used_in_training": True}).in_("id", list(data_ids)).execute()
             
             return True
             
@@ -415,18 +426,15 @@ class PredictiveModelService:
         if not prediction_scores:
             return "", 0.0
             
-        # Aplicar softmax para normalizar las puntuaciones
-        scores = list(prediction_scores.values())
-        exp_scores = np.exp(scores - np.max(scores))
-        softmax_scores = exp_scores / exp_scores.sum()
-        
-        # Convertir de nuevo a diccionario
-        normalized_scores = {k: float(s) for k, s in zip(prediction_scores.keys(), softmax_scores)}
+        # La predicción con mayor puntuación es también la de mayor probabilidad softmax
+        best_prediction = max(prediction_scores, key=prediction_scores.get)
+        max_score = prediction_scores[best_prediction]
         
-        # Obtener la predicción con mayor puntuación
-        best_prediction = max(normalized_scores.items(), key=lambda x: x[1])
+        # Softmax de la mejor predicción: exp(0) / sum(exp(s - max)).
+        # Con pocas clases, math.exp es más barato que crear arrays de NumPy.
+        exp_total = sum(math.exp(score - max_score) for score in prediction_scores.values())
         
-        return best_prediction[0], best_prediction[1]
+        return best_prediction, 1.0 / exp_total
     
     async def store_feedback(self, prediction_id: str, feedback_type: str, 
                        feedback_data: Dict[str, Any], user_id: Optional[str] = None) -> Dict[str, Any]:
@@ -26,6 +26,9 @@ class LeadQualificationService:
         'demographic_fit': 30            # Fit con audiencia target
     }
     
+    # Intereses alineados con nuestro producto (conjunto para búsquedas O(1))
+    TARGET_INTERESTS = frozenset({'fitness', 'salud', 'bienestar', 'nutrición', 'deporte'})
+    
     # Umbral para acceder al agente de voz
     VOICE_AGENT_THRESHOLD = 75
     
@@ -122,9 +125,8 @@ class LeadQualificationService:
             
         # Intereses alineados con nuestro producto
         interests = user_metrics.get('interests', [])
-        target_interests = ['fitness', 'salud', 'bienestar', 'nutrición', 'deporte']
         
-        matching_interests = sum(1 for interest in interests if interest.lower() in target_interests)
+        matching_interests = sum(1 for interest in interests if interest.lower() in self.TARGET_INTERESTS)
         if matching_interests >= 3:
             score += int(max_score * 0.3)  # 9 puntos
         elif matching_interests >= 1:
@@ -175,6 +175,9 @@ class RecommendationService:
                 if "premium" in intent or "completo" in intent:
                     interests.append("premium")
         
+        # Normalizar palabras clave una sola vez para todos los productos
+        lowered_keywords = [keyword.lower() for keyword in keyword_terms]
+        
         # Puntuar productos basados en relevancia
         scored_products = []
         for product in products:
@@ -185,11 +188,13 @@ class RecommendationService:
                 score += 3
             
             # Aumentar puntuación basada en palabras clave
-            for keyword in keyword_terms:
-                if keyword.lower() in product["name"].lower() or keyword.lower() in product["description"].lower():
+            name_lower = product["name"].lower()
+            description_lower = product["description"].lower()
+            for keyword in lowered_keywords:
+                if keyword in name_lower or keyword in description_lower:
                     score += 1
                 for tag in product["tags"]:
-                    if keyword.lower() in tag:
+                    if keyword in tag:
                         score += 0.5
             
             # Aumentar puntuación basada en intereses
@@ -285,17 +290,21 @@ class RecommendationService:
                 if "testimonios" in intent:
                     interests.append("testimonials")
         
+        # Normalizar palabras clave una sola vez para todo el contenido
+        lowered_keywords = [keyword.lower() for keyword in keyword_terms]
+        
         # Puntuar contenido basado en relevancia
         scored_content = []
         for item in content:
             score = 0
             
             # Aumentar puntuación basada en palabras clave
-            for keyword in keyword_terms:
-                if keyword.lower() in item["title"].lower():
+            title_lower = item["title"].lower()
+            for keyword in lowered_keywords:
+                if keyword in title_lower:
                     score += 1
                 for tag in item["tags"]:
-                    if keyword.lower() in tag:
+                    if keyword in tag:
                         score += 0.5
             
             # Aumentar puntuación basada en intereses
@@ -443,11 +452,14 @@ class RecommendationService:
         
         # Razones basadas en palabras clave
         keyword_matches = []
+        name_lower = product["name"].lower()
+        description_lower = product["description"].lower()
         for keyword in keywords:
-            if keyword.lower() in product["name"].lower() or keyword.lower() in product["description"].lower():
+            keyword_lower = keyword.lower()
+            if keyword_lower in name_lower or keyword_lower in description_lower:
                 keyword_matches.append(keyword)
             for tag in product["tags"]:
-                if keyword.lower() in tag:
+                if keyword_lower in tag:
                     keyword_matches.append(keyword)
         
         if keyword_matches:
@@ -161,6 +161,9 @@ class SentimentAlertService:
         """
         detected_alerts = []
         
+        # Una única marca de tiempo para todas las alertas de esta detección
+        now_iso = datetime.now().isoformat()
+        
         # Verificar sentimiento negativo persistente
         if len(sentiment_scores) >= 3:
             recent_scores = sentiment_scores[-3:]
@@ -169,7 +172,7 @@ class SentimentAlertService:
                     "type": "negative_sentiment_persistent",
                     "severity": "alta",
                     "description": "Sentimiento negativo persistente en los últimos 3 mensajes.",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now_iso
                 })
         
         # Verificar caída significativa de sentimiento
@@ -178,7 +181,7 @@ class SentimentAlertService:
                 "type": "sentiment_drop",
                 "severity": "media",
                 "description": f"Caída significativa de sentimiento de {sentiment_changes.get('magnitude', 0):.2f} puntos.",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso
             })
         
         # Verificar frustración
@@ -189,7 +192,7 @@ class SentimentAlertService:
                     "type": "frustration_detected",
                     "severity": "alta",
                     "description": "Alta frustración detectada en el último mensaje.",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now_iso
                 })
         
         # Verificar urgencia alta
@@ -198,7 +201,7 @@ class SentimentAlertService:
                 "type": "high_urgency",
                 "severity": "alta",
                 "description": "Alta urgencia detectada en el último mensaje.",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": now_iso
             })
         
         # Verificar insights de NLP
@@ -211,7 +214,7 @@ class SentimentAlertService:
                     "type": "customer_dissatisfaction",
                     "severity": "alta",
                     "description": "Cliente insatisfecho según análisis de NLP.",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now_iso
                 })
             
             # Verificar fase de insatisfacción
@@ -220,7 +223,7 @@ class SentimentAlertService:
                     "type": "dissatisfaction_phase",
                     "severity": "alta",
                     "description": "Conversación en fase de insatisfacción.",
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": now_iso
                 })
         
         # Generar resultado
@@ -234,7 +237,7 @@ class SentimentAlertService:
                 "last_emotions": last_emotions,
                 "urgency": urgency_analysis
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
         
         # Agregar recomendaciones si hay alertas
@@ -10,7 +10,8 @@ from src.services.utils.signal_detection import (
     detect_sentiment_signals,
     detect_keyword_signals,
     detect_question_patterns,
-    detect_engagement_signals
+    detect_engagement_signals,
+    compile_keyword_pattern
 )
 
 from src.services.utils.scoring import (
@@ -36,6 +37,7 @@ __all__ = [
     'detect_keyword_signals',
     'detect_question_patterns',
     'detect_engagement_signals',
+    'compile_keyword_pattern',
     'normalize_scores',
     'apply_weights',
     'calculate_confidence',
@@ -67,22 +67,31 @@ def extract_features_from_conversation(messages: List[Dict[str, Any]],
     try:
         # Extraer características de mensajes
         if messages:
-            # Separar mensajes por rol
-            client_messages = [msg for msg in messages if msg.get("role") == "user"]
-            agent_messages = [msg for msg in messages if msg.get("role") == "assistant"]
+            # Acumular métricas por rol en una sola pasada, sin listas intermedias
+            client_count = client_length = question_count = 0
+            agent_count = agent_length = 0
+            for msg in messages:
+                role = msg.get("role")
+                if role == "user":
+                    content = msg.get("content", "")
+                    client_count += 1
+                    client_length += len(content)
+                    if "?" in content:
+                        question_count += 1
+                elif role == "assistant":
+                    agent_count += 1
+                    agent_length += len(msg.get("content", ""))
             
             # Características de mensajes del cliente
-            if client_messages:
-                client_text = [msg.get("content", "") for msg in client_messages]
-                features["message_features"]["client_message_count"] = len(client_messages)
-                features["message_features"]["avg_client_message_length"] = sum(len(txt) for txt in client_text) / len(client_text) if client_text else 0
-                features["message_features"]["question_count"] = sum(1 for txt in client_text if "?" in txt)
+            if client_count:
+                features["message_features"]["client_message_count"] = client_count
+                features["message_features"]["avg_client_message_length"] = client_length / client_count
+                features["message_features"]["question_count"] = question_count
                 
             # Características de mensajes del agente
-            if agent_messages:
-                agent_text = [msg.get("content", "") for msg in agent_messages]
-                features["message_features"]["agent_message_count"] = len(agent_messages)
-                features["message_features"]["avg_agent_message_length"] = sum(len(txt) for txt in agent_text) / len(agent_text) if agent_text else 0
+            if agent_count:
+                features["message_features"]["agent_message_count"] = agent_count
+                features["message_features"]["avg_agent_message_length"] = agent_length / agent_count
             
             # Características de la conversación
             features["conversation_features"]["total_messages"] = len(messages)
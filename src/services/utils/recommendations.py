@@ -100,7 +100,7 @@ async def generate_next_best_action(decision_factors: Dict[str, Any],
             # Obtener condiciones de la acción
             conditions = action_template.get("conditions", {})
             
-            # Verificar si se cumplen las condiciones
+            # Verificar si se cumplen las condiciones (se detiene en la primera que falla)
             conditions_met = True
             for condition_key, condition_value in conditions.items():
                 if condition_key in decision_factors:
@@ -124,6 +124,9 @@ async def generate_next_best_action(decision_factors: Dict[str, Any],
                         # Condición de igualdad simple
                         if factor_value != condition_value:
                             conditions_met = False
+                    
+                    if not conditions_met:
+                        break
             
             # Si se cumplen las condiciones, calcular puntuación
             if conditions_met:
@@ -131,12 +134,10 @@ async def generate_next_best_action(decision_factors: Dict[str, Any],
                 impacts = action_template.get("impacts", {})
                 
                 # Calcular puntuación ponderada según impactos y objetivos
-                score = 0
-                for objective, weight in objective_weights.items():
-                    impact = impacts.get(objective, 0)
-                    score += impact * weight
-                
-                action_scores[action_id] = score
+                action_scores[action_id] = sum(
+                    impacts.get(objective, 0) * weight
+                    for objective, weight in objective_weights.items()
+                )
         
         # Seleccionar la acción con mayor puntuación
         if not action_scores:
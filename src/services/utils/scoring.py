@@ -7,7 +7,7 @@ utilizadas por los servicios predictivos.
 
 from typing import Dict, List, Any, Optional
 import logging
-import numpy as np
+import math
 
 logger = logging.getLogger(__name__)
 
@@ -25,15 +25,14 @@ def normalize_scores(scores: Dict[str, float]) -> Dict[str, float]:
         return {}
         
     try:
-        # Extraer valores
-        values = list(scores.values())
-        
-        # Aplicar softmax para normalización
-        exp_values = np.exp(values - np.max(values))
-        softmax_values = exp_values / exp_values.sum()
+        # Aplicar softmax para normalización; con pocas señales, math.exp y
+        # math.fsum evitan el coste de crear arrays de NumPy
+        max_value = max(scores.values())
+        exp_values = {k: math.exp(v - max_value) for k, v in scores.items()}
+        total = math.fsum(exp_values.values())
         
         # Reconstruir diccionario
-        normalized = {k: float(s) for k, s in zip(scores.keys(), softmax_values)}
+        normalized = {k: e / total for k, e in exp_values.items()}
         
         return normalized
         
@@ -90,9 +89,9 @@ def calculate_confidence(scores: Dict[str, float], diversity_factor: float = 0.5
         total = sum(values) or 1
         probabilities = [v / total for v in values]
         
-        # Evitar log(0)
-        entropy = -sum(p * np.log(p) if p > 0 else 0 for p in probabilities)
-        max_entropy = np.log(len(probabilities)) if len(probabilities) > 1 else 1
+        # Evitar log(0); math.log evita el coste de np.log sobre escalares sueltos
+        entropy = -sum(p * math.log(p) for p in probabilities if p > 0)
+        max_entropy = math.log(len(probabilities)) if len(probabilities) > 1 else 1
         normalized_entropy = entropy / max_entropy if max_entropy > 0 else 0
         
         # Calcular confianza basada en puntuación máxima y diversidad
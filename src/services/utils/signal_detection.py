@@ -5,12 +5,46 @@ Este módulo proporciona funciones comunes para detectar diferentes tipos de se
 en mensajes de conversación, utilizadas por los servicios predictivos.
 """
 
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
+import asyncio
 import logging
 import re
 
 logger = logging.getLogger(__name__)
 
+# Patrones de expresiones regulares para diferentes tipos de preguntas
+_QUESTION_PATTERNS = {
+    "direct_questions": re.compile(
+        r'\b(qué|cómo|cuándo|dónde|por qué|quién|cuál|cuánto)\b.*\?', re.IGNORECASE
+    ),
+    "clarification_questions": re.compile(
+        r'\b(podrías|puedes|podría|puede|me puedes|me podrías|explica|explique|aclara|aclare)\b.*\?', re.IGNORECASE
+    ),
+    "comparison_questions": re.compile(
+        r'\b(versus|vs|comparado|comparar|diferencia|mejor|peor|entre)\b', re.IGNORECASE
+    )
+}
+
+# Máximo de llamadas simultáneas al servicio NLP por conversación
+_MAX_CONCURRENT_SENTIMENT_CALLS = 5
+
+@lru_cache(maxsize=1024)
+def compile_keyword_pattern(keyword: str) -> "re.Pattern[str]":
+    """
+    Compila (y memoiza) la expresión regular de palabra completa para una palabra clave.
+    
+    El patrón distingue mayúsculas y minúsculas: quien busque sobre texto en
+    minúsculas debe pasar también la palabra clave en minúsculas.
+    
+    Args:
+        keyword: Palabra clave, tal como debe aparecer en el texto
+        
+    Returns:
+        Patrón compilado que busca la palabra clave como palabra completa
+    """
+    return re.compile(r'\b' + re.escape(keyword) + r'\b')
+
 async def detect_sentiment_signals(messages: List[Dict[str, Any]], nlp_service) -> Dict[str, float]:
     """
     Detecta señales basadas en sentimiento en mensajes.
@@ -35,10 +69,19 @@ async def detect_sentiment_signals(messages: List[Dict[str, Any]], nlp_service)
         if not client_messages:
             return sentiment_signals
             
-        # Analizar sentimiento de los mensajes
-        for message in client_messages:
-            sentiment_result = await nlp_service.analyze_sentiment(message)
-            
+        # Analizar sentimiento de los mensajes de forma concurrente, limitando
+        # las llamadas simultáneas para no saturar el servicio NLP
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_SENTIMENT_CALLS)
+        
+        async def analyze(message: str):
+            async with semaphore:
+                return await nlp_service.analyze_sentiment(message)
+        
+        sentiment_results = await asyncio.gather(
+            *(analyze(message) for message in client_messages)
+        )
+        
+        for sentiment_result in sentiment_results:
             if sentiment_result:
                 sentiment = sentiment_result.get("sentiment", "neutral")
                 score = sentiment_result.get("score", 0.5)
@@ -81,11 +124,17 @@ async def detect_keyword_signals(messages: List[Dict[str, Any]], keywords_dict:
         if not client_messages:
             return keyword_signals
             
+        # Preparar los patrones una sola vez, no por cada mensaje
+        category_patterns = [
+            (category, [compile_keyword_pattern(keyword.lower()) for keyword in keywords])
+            for category, keywords in keywords_dict.items()
+        ]
+        
         # Buscar palabras clave en los mensajes
         for message in client_messages:
-            for category, keywords in keywords_dict.items():
-                for keyword in keywords:
-                    if re.search(r'\b' + re.escape(keyword.lower()) + r'\b', message):
+            for category, patterns in category_patterns:
+                for pattern in patterns:
+                    if pattern.search(message):
                         keyword_signals[category] += 1
         
         # Normalizar las señales
@@ -122,17 +171,10 @@ async def detect_question_patterns(messages: List[Dict[str, Any]]) -> Dict[str,
         if not client_messages:
             return question_signals
             
-        # Patrones de expresiones regulares para diferentes tipos de preguntas
-        patterns = {
-            "direct_questions": r'\b(qué|cómo|cuándo|dónde|por qué|quién|cuál|cuánto)\b.*\?',
-            "clarification_questions": r'\b(podrías|puedes|podría|puede|me puedes|me podrías|explica|explique|aclara|aclare)\b.*\?',
-            "comparison_questions": r'\b(versus|vs|comparado|comparar|diferencia|mejor|peor|entre)\b'
-        }
-        
         # Buscar patrones en los mensajes
         for message in client_messages:
-            for pattern_type, pattern in patterns.items():
-                if re.search(pattern, message, re.IGNORECASE):
+            for pattern_type, pattern in _QUESTION_PATTERNS.items():
+                if pattern.search(message):
                     question_signals[pattern_type] += 1
         
         # Normalizar las señales
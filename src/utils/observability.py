@@ -2,41 +2,70 @@
 
 Inicializa trazas distribuidas y métricas usando OpenTelemetry. Exporta en formato
 OTLP para ser consumido por Prometheus/Grafana u otros back-ends compatibles.
+
+Los módulos de OpenTelemetry (y sus instrumentaciones, que arrastran httpx,
+asyncpg, wrapt, grpc...) se importan dentro de las funciones: importar este
+módulo es barato y solo se paga el coste cuando realmente se inicializa.
 """
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 from fastapi import FastAPI
-from opentelemetry import trace, metrics
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
-try:
-    # Versión >=1.23.0
-    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-except ImportError:  # pragma: no cover
-    # Compatibilidad con versiones <1.23
-    from opentelemetry.sdk.trace.export import OTLPSpanExporter
-from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
-from opentelemetry.instrumentation.asyncpg import AsyncPGInstrumentor
-from opentelemetry.instrumentation.logging import LoggingInstrumentor
-from opentelemetry.sdk.metrics import MeterProvider
-try:
-    from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader, OTLPMetricExporter
-except ImportError:
-    # Fallback for older versions or missing dependencies
-    PeriodicExportingMetricReader = None
-    OTLPMetricExporter = None
 import os
 import logging
 
+if TYPE_CHECKING:  # pragma: no cover
+    from grpc import Compression
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace.sampling import Sampler
+
 logger = logging.getLogger(__name__)
 
 _OTEL_ENDPOINT_ENV = "OTEL_EXPORTER_OTLP_ENDPOINT"
 _DEFAULT_OTEL_ENDPOINT = "http://localhost:4317"
+# Permite activar OpenTelemetry en pruebas que necesiten trazas reales
+_OTEL_FORCE_ENABLE_ENV = "OTEL_FORCE_ENABLE"
+
+# Desactiva por completo trazas, métricas e instrumentaciones
+_OTEL_SDK_DISABLED_ENV = "OTEL_SDK_DISABLED"
+
+# Indica si OpenTelemetry ya se inicializó en este proceso
+_initialized = False
+
+# Rutas de infraestructura (probes y scraping) que no se trazan
+_FASTAPI_EXCLUDED_URLS_ENV = "OTEL_PYTHON_FASTAPI_EXCLUDED_URLS"
+_DEFAULT_EXCLUDED_URLS = "/health,/metrics,/ready"
+
+# Activación de las instrumentaciones de cliente ("1" = activada)
+_INSTRUMENT_HTTPX_ENV = "OTEL_INSTRUMENT_HTTPX"
+_INSTRUMENT_ASYNCPG_ENV = "OTEL_INSTRUMENT_ASYNCPG"
+
+# Fracción de trazas muestreadas en origen (por defecto 10% en producción)
+_OTEL_SAMPLER_ARG_ENV = "OTEL_TRACES_SAMPLER_ARG"
+_PRODUCTION_SAMPLE_RATIO = 0.1
+
+# Compresión de los exportadores OTLP (gzip por defecto: los atributos de los
+# spans son mayormente texto y se comprimen muy bien)
+_OTEL_COMPRESSION_ENV = "OTEL_EXPORTER_OTLP_COMPRESSION"
+_COMPRESSION_BY_NAME = {
+    "gzip": "Gzip",
+    "deflate": "Deflate",
+    "none": "NoCompression",
+}
 
+# Parámetros del BatchSpanProcessor: (variable de entorno, valor por defecto).
+# Cola más grande y lotes más pequeños/frecuentes que los del SDK para no
+# descartar spans en ráfagas de tráfico.
+_BSP_SETTINGS = {
+    "max_queue_size": ("OTEL_BSP_MAX_QUEUE_SIZE", 4096),
+    "max_export_batch_size": ("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", 256),
+    "schedule_delay_millis": ("OTEL_BSP_SCHEDULE_DELAY", 1000),
+    "export_timeout_millis": ("OTEL_BSP_EXPORT_TIMEOUT", 10000),
+}
+
+
+def _create_resource() -> "Resource":
+    from opentelemetry.sdk.resources import Resource
 
-def _create_resource() -> Resource:
     return Resource.create({
         "service.name": os.getenv("SERVICE_NAME", "ngx-sales-agent"),
         "service.version": os.getenv("SERVICE_VERSION", "0.1.0"),
@@ -44,6 +73,54 @@ def _create_resource() -> Resource:
     })
 
 
+def _create_sampler() -> "Sampler":
+    """Crea un sampler que respeta la decisión del padre y muestrea por ratio las raíces."""
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    default_ratio = _PRODUCTION_SAMPLE_RATIO if os.getenv("ENVIRONMENT", "development").lower() == "production" else 1.0
+    value = os.getenv(_OTEL_SAMPLER_ARG_ENV)
+    try:
+        ratio = float(value) if value else default_ratio
+    except ValueError:
+        logger.warning(f"Valor inválido para {_OTEL_SAMPLER_ARG_ENV}: {value!r}; se usa {default_ratio}")
+        ratio = default_ratio
+    return ParentBased(TraceIdRatioBased(min(max(ratio, 0.0), 1.0)))
+
+
+def _otlp_compression() -> "Compression":
+    """Obtiene el algoritmo de compresión de los exportadores OTLP desde el entorno."""
+    from grpc import Compression
+
+    name = os.getenv(_OTEL_COMPRESSION_ENV, "gzip").strip().lower()
+    if name not in _COMPRESSION_BY_NAME:
+        logger.warning(f"Valor inválido para {_OTEL_COMPRESSION_ENV}: {name!r}; se usa gzip")
+    return getattr(Compression, _COMPRESSION_BY_NAME.get(name, "Gzip"))
+
+
+def _batch_span_processor_kwargs() -> Dict[str, int]:
+    """Obtiene los parámetros del BatchSpanProcessor desde el entorno."""
+    kwargs = {}
+    for param, (env_var, default) in _BSP_SETTINGS.items():
+        value = os.getenv(env_var)
+        try:
+            kwargs[param] = int(value) if value else default
+        except ValueError:
+            logger.warning(f"Valor inválido para {env_var}: {value!r}; se usa {default}")
+            kwargs[param] = default
+    return kwargs
+
+
+def _instrument_fastapi_app(app: FastAPI) -> None:
+    """Instrumenta una aplicación FastAPI (sin efecto si ya estaba instrumentada)."""
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+
+    # Las probes de salud/métricas se consultan constantemente y no aportan nada como traza
+    FastAPIInstrumentor.instrument_app(
+        app,
+        excluded_urls=os.getenv(_FASTAPI_EXCLUDED_URLS_ENV, _DEFAULT_EXCLUDED_URLS),
+    )
+
+
 def init_observability(app: FastAPI, endpoint: Optional[str] = None) -> None:
     """Inicializa OpenTelemetry para la aplicación FastAPI.
 
@@ -52,30 +129,96 @@ def init_observability(app: FastAPI, endpoint: Optional[str] = None) -> None:
         endpoint: URL del collector OTLP. Si no se especifica, se tomará de la
             variable de entorno `OTEL_EXPORTER_OTLP_ENDPOINT` o se usará el valor
             por defecto localhost.
+
+    Con `OTEL_SDK_DISABLED=true` se instalan proveedores no-op y ninguna
+    instrumentación. Con `ENVIRONMENT=testing` no se inicializa nada (sin
+    instrumentaciones ni hilo exportador), salvo que se defina
+    `OTEL_FORCE_ENABLE=1`. Los proveedores y las instrumentaciones globales se
+    instalan una sola vez por proceso; las llamadas posteriores solo
+    instrumentan la aplicación recibida.
     """
+    global _initialized
+
+    if os.getenv(_OTEL_SDK_DISABLED_ENV, "").strip().lower() == "true":
+        # Proveedores no-op: get_tracer()/get_meter() devuelven objetos sin coste
+        # y no se instala ninguna instrumentación
+        if not _initialized:
+            from opentelemetry import trace, metrics
+
+            trace.set_tracer_provider(trace.NoOpTracerProvider())
+            metrics.set_meter_provider(metrics.NoOpMeterProvider())
+            _initialized = True
+            logger.info("OpenTelemetry desactivado por OTEL_SDK_DISABLED")
+        return
+
+    if _initialized:
+        # Proveedores e instrumentaciones globales ya instalados: solo falta la app
+        _instrument_fastapi_app(app)
+        return
+
+    if os.getenv("ENVIRONMENT") == "testing" and os.getenv(_OTEL_FORCE_ENABLE_ENV) != "1":
+        logger.debug("Entorno de pruebas: se omite la inicialización de OpenTelemetry")
+        return
+
+    from opentelemetry import trace, metrics
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    try:
+        # Versión >=1.23.0
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+    except ImportError:  # pragma: no cover
+        # Compatibilidad con versiones <1.23
+        from opentelemetry.sdk.trace.export import OTLPSpanExporter
+    from opentelemetry.instrumentation.logging import LoggingInstrumentor
+    from opentelemetry.sdk.metrics import MeterProvider
+    try:
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader, OTLPMetricExporter
+    except ImportError:
+        # Fallback for older versions or missing dependencies
+        PeriodicExportingMetricReader = None
+        OTLPMetricExporter = None
+
     endpoint = endpoint or os.getenv(_OTEL_ENDPOINT_ENV, _DEFAULT_OTEL_ENDPOINT)
+    compression = _otlp_compression()
+    # Un único Resource compartido por trazas y métricas
+    resource = _create_resource()
 
     # Traza
-    tracer_provider = TracerProvider(resource=_create_resource())
-    span_processor = BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint, insecure=True))
+    tracer_provider = TracerProvider(resource=resource, sampler=_create_sampler())
+    span_processor = BatchSpanProcessor(
+        OTLPSpanExporter(endpoint=endpoint, insecure=True, compression=compression),
+        **_batch_span_processor_kwargs(),
+    )
     tracer_provider.add_span_processor(span_processor)
     trace.set_tracer_provider(tracer_provider)
 
     # Métricas (solo si están disponibles)
     if PeriodicExportingMetricReader and OTLPMetricExporter:
         metric_reader = PeriodicExportingMetricReader(
-            exporter=OTLPMetricExporter(endpoint=endpoint, insecure=True),
+            exporter=OTLPMetricExporter(endpoint=endpoint, insecure=True, compression=compression),
             export_interval_millis=int(os.getenv("OTEL_EXPORT_INTERVAL", "60000")),
         )
-        meter_provider = MeterProvider(resource=_create_resource(), metric_readers=[metric_reader])
+        meter_provider = MeterProvider(resource=resource, metric_readers=[metric_reader])
         metrics.set_meter_provider(meter_provider)
     else:
         logger.warning("OpenTelemetry metrics not available - skipping metric configuration")
 
     # Instrumentaciones automáticas
-    FastAPIInstrumentor.instrument_app(app)
-    HTTPXClientInstrumentor().instrument()
-    AsyncPGInstrumentor().instrument()
-    LoggingInstrumentor().instrument(set_logging_format=True)
+    _instrument_fastapi_app(app)
+    # Las instrumentaciones de cliente (una span por llamada HTTP o consulta SQL)
+    # se pueden desactivar por entorno si solo interesan las trazas de FastAPI
+    if os.getenv(_INSTRUMENT_HTTPX_ENV, "1") == "1":
+        from opentelemetry.instrumentation.httpx import HTTPXClientInstrumentor
+
+        HTTPXClientInstrumentor().instrument()
+    if os.getenv(_INSTRUMENT_ASYNCPG_ENV, "1") == "1":
+        from opentelemetry.instrumentation.asyncpg import AsyncPGInstrumentor
+
+        AsyncPGInstrumentor().instrument()
+    # Solo añade los IDs de traza a los registros; el JSONFormatter de
+    # structured_logging ya los incluye, sin reemplazar el formato global
+    LoggingInstrumentor().instrument()
+
+    _initialized = True
 
     logger.info("OpenTelemetry inicializado para FastAPI", extra={"otel_endpoint": endpoint})
@@ -51,6 +51,12 @@ class JSONFormatter(logging.Formatter):
             "thread_id": record.thread
         }
         
+        # Correlación con trazas (atributos añadidos por el LoggingInstrumentor de OpenTelemetry)
+        trace_id = getattr(record, "otelTraceID", "0")
+        if trace_id != "0":
+            log_data["trace_id"] = trace_id
+            log_data["span_id"] = getattr(record, "otelSpanID", "0")
+        
         # Añadir información de excepción si está disponible
         if record.exc_info:
             log_data["exception"] = {
@@ -116,6 +116,27 @@ async def test_agent_interaction(
     logger.info("--- Simulación de interacción finalizada ---")
     print("DEBUG: Fin de test_agent_interaction.") # DEBUG
 
+async def run_scenarios(scenarios: list[tuple[str, str, str, list[str]]]):
+    """
+    Ejecuta en paralelo varios escenarios independientes.
+    
+    Cada escenario es una conversación distinta, por lo que pueden solaparse;
+    dentro de cada conversación los mensajes se siguen enviando en orden.
+    
+    Args:
+        scenarios (list): Tuplas (título, nombre del cliente, programa, mensajes).
+    """
+    for title, _, _, _ in scenarios:
+        logger.info(f"\n========== INICIANDO {title} ==========")
+    await asyncio.gather(*(
+        test_agent_interaction(
+            customer_name=customer_name,
+            program_type=program_type,
+            test_messages=test_messages
+        )
+        for _, customer_name, program_type, test_messages in scenarios
+    ))
+
 def main():
     print("DEBUG: Dentro de main().") # DEBUG
     """Función principal."""
@@ -145,30 +166,16 @@ def main():
     ]
 
     # --- Ejecutar escenarios --- 
-    # Descomenta los escenarios que quieres probar
-    
-    logger.info("\n========== INICIANDO ESCENARIO 1: Detalles del Programa PRIME ==========")
-    print("DEBUG: Llamando a asyncio.run para escenario_1_detalles_prime...") # DEBUG
-    asyncio.run(test_agent_interaction(
-        customer_name=args.name,
-        program_type="PRIME",
-        test_messages=escenario_1_detalles_prime
-    ))
-    print("DEBUG: asyncio.run para escenario_1_detalles_prime completado.") # DEBUG
-
-    # logger.info("\n========== INICIANDO ESCENARIO 2: Objeción de Precio LONGEVITY ==========")
-    # asyncio.run(test_agent_interaction(
-    #     customer_name="Roberto Diaz",
-    #     program_type="LONGEVITY",
-    #     test_messages=escenario_2_objecion_longevity
-    # ))
+    # Descomenta los escenarios que quieres probar (se ejecutan en paralelo)
+    escenarios = [
+        ("ESCENARIO 1: Detalles del Programa PRIME", args.name, "PRIME", escenario_1_detalles_prime),
+        # ("ESCENARIO 2: Objeción de Precio LONGEVITY", "Roberto Diaz", "LONGEVITY", escenario_2_objecion_longevity),
+        # ("ESCENARIO 3: Flujo Natural con Objeción PRIME", "Laura Sanchez", "PRIME", escenario_3_flujo_natural_prime),
+    ]
     
-    # logger.info("\n========== INICIANDO ESCENARIO 3: Flujo Natural con Objeción PRIME ==========")
-    # asyncio.run(test_agent_interaction(
-    #     customer_name="Laura Sanchez",
-    #     program_type="PRIME",
-    #     test_messages=escenario_3_flujo_natural_prime
-    # ))
+    logger.debug(f"Llamando a asyncio.run para {len(escenarios)} escenario(s)...")
+    asyncio.run(run_scenarios(escenarios))
+    logger.debug("asyncio.run completado.")
 
 if __name__ == "__main__":
     print("DEBUG: Bloque if __name__ == '__main__' alcanzado.") # DEBUG
@@ -2,7 +2,6 @@ import pytest
 pytest.skip("manual script", allow_module_level=True)
 import os
 import sys
-import asyncio
 import uuid
 from dotenv import load_dotenv
 import logging
@@ -19,7 +18,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.integrations.supabase import supabase_client
 
-async def test_supabase_operations():
+def test_supabase_operations():
     """Probar operaciones básicas con Supabase."""
     
     # 1. Obtener cliente
@@ -45,20 +44,13 @@ async def test_supabase_operations():
     
     try:
         # Insertar el cliente
-        response = await asyncio.to_thread(
-            lambda: client.table("customers").upsert(test_customer).execute()
-        )
-        logger.info(f"Cliente insertado: {response.data}")
+        response = client.table("customers").upsert(test_customer).execute()
         
-        # Consultar el cliente insertado
-        query_response = await asyncio.to_thread(
-            lambda: client.table("customers").select("*").eq("id", test_customer_id).single().execute()
-        )
-        
-        if query_response.data:
-            logger.info(f"Cliente recuperado: {query_response.data}")
+        # El upsert ya devuelve la fila escrita; no hace falta volver a consultarla
+        if response.data:
+            logger.info(f"Cliente insertado: {response.data[0]}")
         else:
-            logger.error("No se pudo recuperar el cliente insertado")
+            logger.error("No se pudo insertar el cliente de prueba")
         
         # 3. Crear una conversación para este cliente
         conversation_id = str(uuid.uuid4())
@@ -78,20 +70,12 @@ async def test_supabase_operations():
         logger.info(f"Insertando conversación de prueba con ID: {conversation_id}")
         
         # Insertar la conversación
-        conv_response = await asyncio.to_thread(
-            lambda: client.table("conversations").insert(conversation).execute()
-        )
-        logger.info(f"Conversación insertada: {conv_response.data}")
-        
-        # Consultar la conversación insertada
-        conv_query_response = await asyncio.to_thread(
-            lambda: client.table("conversations").select("*").eq("conversation_id", conversation_id).single().execute()
-        )
+        conv_response = client.table("conversations").insert(conversation).execute()
         
-        if conv_query_response.data:
-            logger.info(f"Conversación recuperada: {conv_query_response.data}")
+        if conv_response.data:
+            logger.info(f"Conversación insertada: {conv_response.data[0]}")
         else:
-            logger.error("No se pudo recuperar la conversación insertada")
+            logger.error("No se pudo insertar la conversación de prueba")
             
         return True
         
@@ -100,5 +84,5 @@ async def test_supabase_operations():
         return False
 
 if __name__ == "__main__":
-    result = asyncio.run(test_supabase_operations())
+    result = test_supabase_operations()
     sys.exit(0 if result else 1) 
\ No newline at end of file
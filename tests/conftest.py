@@ -7,6 +7,8 @@ Este módulo contiene fixtures y configuraciones comunes para las pruebas.
 import os
 import sys
 import pytest
+from pathlib import Path
+from types import SimpleNamespace
 from dotenv import load_dotenv
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -42,12 +44,26 @@ WIP_TESTS = [
     "test_repository.py::test_supabase_repo_delete",
 ]
 
+# Directorio donde se guardan los perfiles de --profile
+PROFILE_DIR = Path("prof")
+
+def pytest_addoption(parser):
+    """Registrar opciones de línea de comandos propias de la suite."""
+    parser.addoption(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="Perfilar cada test con pyinstrument y guardar el HTML en prof/",
+    )
+
 # Función para marcar tests como estables o en progreso
 def pytest_collection_modifyitems(config, items):
     """Marcar tests como estables o en progreso basado en las listas definidas."""
     for item in items:
-        # Obtener el nombre del test en formato módulo::función
-        test_id = f"{item.module.__name__.split('.')[-1]}::{item.name}"
+        # Obtener el nombre del test en formato módulo::función (sin los
+        # parámetros, para que las listas cubran todos los casos parametrizados)
+        test_name = getattr(item, "originalname", None) or item.name
+        test_id = f"{item.module.__name__.split('.')[-1]}::{test_name}"
         
         # Marcar como estable o en progreso
         if test_id in STABLE_TESTS:
@@ -68,6 +84,13 @@ if not os.getenv("JWT_REFRESH_TOKEN_EXPIRE_DAYS"):
     os.environ["JWT_REFRESH_TOKEN_EXPIRE_DAYS"] = "7"
 if not os.getenv("ENVIRONMENT"):
     os.environ["ENVIRONMENT"] = "testing"
+# La aplicación exige ALLOWED_ORIGINS al importarse (src/api/main.py)
+if not os.getenv("ALLOWED_ORIGINS"):
+    os.environ["ALLOWED_ORIGINS"] = "http://testserver,http://localhost:8000"
+if not os.getenv("RATE_LIMIT_PER_MINUTE"):
+    os.environ["RATE_LIMIT_PER_MINUTE"] = "60"
+if not os.getenv("RATE_LIMIT_PER_HOUR"):
+    os.environ["RATE_LIMIT_PER_HOUR"] = "1000"
 
 # Importar la aplicación solo si se necesita para pruebas de integración
 # Comentamos esta línea para evitar problemas con las pruebas unitarias
@@ -84,10 +107,73 @@ def get_app():
     from src.api.main import app
     return app
 
-@pytest.fixture
-def client():
+@pytest.fixture(autouse=True)
+def auto_profile(request):
+    """
+    Perfila el test con pyinstrument cuando se ejecuta con --profile.
+    
+    Sin la opción no hace nada; pyinstrument solo se importa al perfilar.
+    """
+    if not request.config.getoption("--profile"):
+        yield
+        return
+    
+    from pyinstrument import Profiler
+    
+    profiler = Profiler()
+    profiler.start()
+    yield
+    profiler.stop()
+    
+    PROFILE_DIR.mkdir(exist_ok=True)
+    (PROFILE_DIR / f"{request.node.name}.html").write_text(profiler.output_html())
+
+@pytest.fixture(scope="session")
+def jwt_env():
+    """
+    Configuración JWT de la ejecución, leída una sola vez del entorno.
+    
+    Returns:
+        SimpleNamespace: secret, alg y exp_min (minutos de vida del token de acceso)
+    """
+    return SimpleNamespace(
+        secret=os.environ.get("JWT_SECRET", "test_secret_key_for_testing_only"),
+        alg=os.environ.get("JWT_ALGORITHM", "HS256"),
+        exp_min=int(os.environ.get("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", 30)),
+    )
+
+@pytest.fixture(scope="session")
+def fake_supabase():
+    """
+    Fuerza el cliente de Supabase en memoria si USE_FAKE_SUPABASE=1.
+    
+    Con credenciales reales configuradas, el cliente compartido de la
+    aplicación usaría la red; con la variable activa, las pruebas de
+    integración trabajan contra MockSupabaseClient. El cambio se deshace al
+    terminar la sesión.
+    
+    Returns:
+        bool: True si se está usando el cliente en memoria
+    """
+    if os.getenv("USE_FAKE_SUPABASE", "0") != "1":
+        yield False
+        return
+    
+    from src.integrations.supabase.client import MockSupabaseClient, supabase_client
+    
+    mp = pytest.MonkeyPatch()
+    mp.setattr(supabase_client, "_mock_enabled", True)
+    mp.setattr(supabase_client, "mock_client", MockSupabaseClient(), raising=False)
+    yield True
+    mp.undo()
+
+@pytest.fixture(scope="session")
+def client(fake_supabase):
     """
     Fixture que proporciona un cliente de prueba para la API.
+    
+    Se comparte durante toda la sesión para ejecutar el arranque de la
+    aplicación una sola vez.
     """
     app = get_app()
     with TestClient(app) as test_client:
@@ -126,108 +212,94 @@ def mock_supabase_client():
     
     return _DummyClient()
 
-@pytest.fixture
-def test_user():
+# Usuarios de prueba compartidos por los fixtures (los fixtures devuelven copias)
+_TEST_USER = {
+    "username": "test_user",
+    "email": "test@example.com",
+    "password": "test_password",
+    "full_name": "Test User",
+    "permissions": ["read:models", "read:analytics"]
+}
+
+_TEST_ADMIN = {
+    "username": "test_admin",
+    "email": "admin@example.com",
+    "password": "admin_password",
+    "full_name": "Test Admin",
+    "permissions": ["admin"]
+}
+
+@pytest.fixture(scope="session")
+def seeded_users(client):
     """
-    Fixture que proporciona datos de un usuario de prueba.
+    Fixture que registra una sola vez por sesión los usuarios de prueba.
+    
+    Los registros duplicados se ignoran: basta con que los usuarios existan
+    para las pruebas que inician sesión con ellos.
     """
-    return {
-        "username": "test_user",
-        "email": "test@example.com",
-        "password": "test_password",
-        "full_name": "Test User",
-        "permissions": ["read:models", "read:analytics"]
-    }
+    for user, is_admin in ((_TEST_USER, False), (_TEST_ADMIN, True)):
+        register_data = {
+            "username": user["username"],
+            "email": user["email"],
+            "password": user["password"],
+            "full_name": user["full_name"]
+        }
+        if is_admin:
+            register_data["is_admin"] = True
+        client.post("/auth/register", json=register_data)
+    
+    return {"user": _TEST_USER, "admin": _TEST_ADMIN}
 
 @pytest.fixture
-def test_admin():
+def test_user(seeded_users):
     """
-    Fixture que proporciona datos de un usuario administrador de prueba.
+    Fixture que proporciona datos de un usuario de prueba (ya registrado).
     """
-    return {
-        "username": "test_admin",
-        "email": "admin@example.com",
-        "password": "admin_password",
-        "full_name": "Test Admin",
-        "permissions": ["admin"]
-    }
+    return dict(_TEST_USER)
 
 @pytest.fixture
-def auth_headers(client, test_user):
+def test_admin(seeded_users):
     """
-    Fixture que proporciona encabezados de autenticación para un usuario normal.
+    Fixture que proporciona datos de un usuario administrador de prueba (ya registrado).
     """
-    # Iniciar sesión para obtener token
-    response = client.post(
-        "/auth/login",
-        data={
-            "username": test_user["username"],
-            "password": test_user["password"]
-        }
-    )
+    return dict(_TEST_ADMIN)
+
+@pytest.fixture(scope="session")
+def session_access_tokens(client, seeded_users):
+    """
+    Fixture que inicia sesión una vez por sesión con cada usuario de prueba.
     
-    # Si el usuario no existe, crearlo primero
-    if response.status_code == 401:
-        client.post(
-            "/auth/register",
-            json={
-                "username": test_user["username"],
-                "email": test_user["email"],
-                "password": test_user["password"],
-                "full_name": test_user["full_name"]
-            }
-        )
-        
-        # Ahora iniciar sesión
+    Los tokens salen de /auth/login, así que llevan el id, rol y permisos
+    reales del usuario registrado.
+    
+    Returns:
+        Dict con el token de acceso de "user" y de "admin"
+    """
+    tokens = {}
+    for key, user in seeded_users.items():
         response = client.post(
             "/auth/login",
             data={
-                "username": test_user["username"],
-                "password": test_user["password"]
+                "username": user["username"],
+                "password": user["password"]
             }
         )
-    
-    token = response.json()["data"]["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+        tokens[key] = response.json()["data"]["access_token"]
+    return tokens
 
 @pytest.fixture
-def admin_headers(client, test_admin):
+def auth_headers(session_access_tokens):
+    """
+    Fixture que proporciona encabezados de autenticación para un usuario normal.
+    """
+    return {"Authorization": f"Bearer {session_access_tokens['user']}"}
+
+@pytest.fixture
+def admin_headers(session_access_tokens):
     """
     Fixture que proporciona encabezados de autenticación para un usuario administrador.
     """
-    # Iniciar sesión para obtener token
-    response = client.post(
-        "/auth/login",
-        data={
-            "username": test_admin["username"],
-            "password": test_admin["password"]
-        }
-    )
-    
-    # Si el administrador no existe, crearlo primero
-    if response.status_code == 401:
-        client.post(
-            "/auth/register",
-            json={
-                "username": test_admin["username"],
-                "email": test_admin["email"],
-                "password": test_admin["password"],
-                "full_name": test_admin["full_name"],
-                "is_admin": True
-            }
-        )
-        
-        # Ahora iniciar sesión
-        response = client.post(
-            "/auth/login",
-            data={
-                "username": test_admin["username"],
-                "password": test_admin["password"]
-            }
-        )
-    
-    token = response.json()["data"]["access_token"]
-    return {"Authorization": f"Bearer {token}"}
+    return {"Authorization": f"Bearer {session_access_tokens['admin']}"}
 
 @pytest.fixture
 def mock_supabase():
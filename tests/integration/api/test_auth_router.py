@@ -30,11 +30,12 @@ class TestAuthRouter:
         
         # Verificar respuesta
         assert response.status_code == 201
-        assert response.json()["success"] is True
-        assert "data" in response.json()
-        assert "user_id" in response.json()["data"]
-        assert "username" in response.json()["data"]
-        assert response.json()["data"]["username"] == user_data["username"]
+        body = response.json()
+        assert body["success"] is True
+        assert "data" in body
+        assert "user_id" in body["data"]
+        assert "username" in body["data"]
+        assert body["data"]["username"] == user_data["username"]
     
     def test_register_duplicate_username(self, client, test_user):
         """Prueba el registro con un nombre de usuario duplicado."""
@@ -51,10 +52,11 @@ class TestAuthRouter:
         
         # Verificar respuesta de error
         assert response.status_code == 400
-        assert response.json()["success"] is False
-        assert "error" in response.json()
-        assert "code" in response.json()["error"]
-        assert response.json()["error"]["code"] == "DUPLICATE_USERNAME"
+        body = response.json()
+        assert body["success"] is False
+        assert "error" in body
+        assert "code" in body["error"]
+        assert body["error"]["code"] == "DUPLICATE_USERNAME"
     
     def test_login_success(self, client, test_user):
         """Prueba el inicio de sesión exitoso."""
@@ -69,12 +71,13 @@ class TestAuthRouter:
         
         # Verificar respuesta
         assert response.status_code == 200
-        assert response.json()["success"] is True
-        assert "data" in response.json()
-        assert "access_token" in response.json()["data"]
-        assert "refresh_token" in response.json()["data"]
-        assert "token_type" in response.json()["data"]
-        assert response.json()["data"]["token_type"] == "bearer"
+        body = response.json()
+        assert body["success"] is True
+        assert "data" in body
+        assert "access_token" in body["data"]
+        assert "refresh_token" in body["data"]
+        assert "token_type" in body["data"]
+        assert body["data"]["token_type"] == "bearer"
     
     def test_login_invalid_credentials(self, client):
         """Prueba el inicio de sesión con credenciales inválidas."""
@@ -89,10 +92,11 @@ class TestAuthRouter:
         
         # Verificar respuesta de error
         assert response.status_code == 401
-        assert response.json()["success"] is False
-        assert "error" in response.json()
-        assert "code" in response.json()["error"]
-        assert response.json()["error"]["code"] == "INVALID_CREDENTIALS"
+        body = response.json()
+        assert body["success"] is False
+        assert "error" in body
+        assert "code" in body["error"]
+        assert body["error"]["code"] == "INVALID_CREDENTIALS"
     
     def test_refresh_token_success(self, client, auth_headers):
         """Prueba el refresco exitoso de token."""
@@ -114,10 +118,11 @@ class TestAuthRouter:
         
         # Verificar respuesta
         assert response.status_code == 200
-        assert response.json()["success"] is True
-        assert "data" in response.json()
-        assert "access_token" in response.json()["data"]
-        assert "refresh_token" in response.json()["data"]
+        body = response.json()
+        assert body["success"] is True
+        assert "data" in body
+        assert "access_token" in body["data"]
+        assert "refresh_token" in body["data"]
     
     def test_refresh_token_invalid(self, client):
         """Prueba el refresco de token con un token inválido."""
@@ -129,10 +134,11 @@ class TestAuthRouter:
         
         # Verificar respuesta de error
         assert response.status_code == 401
-        assert response.json()["success"] is False
-        assert "error" in response.json()
-        assert "code" in response.json()["error"]
-        assert response.json()["error"]["code"] == "INVALID_TOKEN"
+        body = response.json()
+        assert body["success"] is False
+        assert "error" in body
+        assert "code" in body["error"]
+        assert body["error"]["code"] == "INVALID_TOKEN"
     
     def test_get_user_info(self, client, auth_headers):
         """Prueba obtener información del usuario autenticado."""
@@ -141,11 +147,12 @@ class TestAuthRouter:
         
         # Verificar respuesta
         assert response.status_code == 200
-        assert response.json()["success"] is True
-        assert "data" in response.json()
-        assert "username" in response.json()["data"]
-        assert "email" in response.json()["data"]
-        assert "permissions" in response.json()["data"]
+        body = response.json()
+        assert body["success"] is True
+        assert "data" in body
+        assert "username" in body["data"]
+        assert "email" in body["data"]
+        assert "permissions" in body["data"]
     
     def test_get_user_info_unauthorized(self, client):
         """Prueba obtener información del usuario sin autenticación."""
@@ -154,6 +161,7 @@ class TestAuthRouter:
         
         # Verificar respuesta de error
         assert response.status_code == 401
-        assert response.json()["success"] is False
-        assert "error" in response.json()
-        assert "code" in response.json()["error"]
+        body = response.json()
+        assert body["success"] is False
+        assert "error" in body
+        assert "code" in body["error"]
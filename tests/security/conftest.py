@@ -1,27 +1,83 @@
 """
 Configuración para pruebas de seguridad.
 
-Este módulo proporciona fixtures para las pruebas de seguridad.
+Este módulo proporciona fixtures para las pruebas de seguridad. Los datos de
+usuario, los tokens y los encabezados son de sesión: sus valores no dependen
+de la prueba, así que cada token se firma una sola vez por ejecución.
 """
 
 import pytest
 from fastapi.testclient import TestClient
 from tests.security.security_test_config import (
-    get_test_client, create_test_user_token, create_test_admin_token,
-    get_auth_headers, JWT_SECRET, JWT_ALGORITHM
+    get_test_client, get_auth_headers, JWT_SECRET, JWT_ALGORITHM,
+    TEST_USER, TEST_ADMIN, USER_TOKEN, ADMIN_TOKEN, SECURITY_TEST_ENV
 )
 
-@pytest.fixture
+# Encabezados de autorización, construidos una vez al importar el módulo
+AUTH_HEADERS = get_auth_headers(USER_TOKEN)
+ADMIN_HEADERS = get_auth_headers(ADMIN_TOKEN)
+
+@pytest.fixture(scope="session", autouse=True)
+def security_test_env():
+    """
+    Fija las variables de entorno de las pruebas de seguridad.
+    
+    Al ser autouse y de sesión se ejecuta antes que security_client, es decir,
+    antes de importar la aplicación. Los valores previos se restauran al
+    terminar la sesión.
+    """
+    mp = pytest.MonkeyPatch()
+    for name, value in SECURITY_TEST_ENV.items():
+        mp.setenv(name, value)
+    yield
+    mp.undo()
+
+@pytest.fixture(autouse=True)
+def clear_jwt_payload_cache():
+    """
+    Vacía la caché de payloads JWT antes de cada prueba.
+    
+    Así las pruebas de tokens inválidos o expirados no se ven afectadas por
+    tokens validados en pruebas anteriores.
+    """
+    from src.auth.jwt_cache import clear_jwt_cache
+    clear_jwt_cache()
+    yield
+
+@pytest.fixture(scope="session")
 def security_client():
     """
     Fixture que proporciona un cliente de prueba para las pruebas de seguridad.
     
+    Se comparte durante toda la sesión: la aplicación es la misma en todas las
+    pruebas, así que basta con construir el cliente una vez.
+    
     Returns:
         TestClient: Cliente de prueba para la API.
     """
     return get_test_client()
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def reset_rate_limiter(request):
+    """
+    Vacía el registro del limitador de tasa antes de cada prueba.
+    
+    El cliente es de sesión, así que sin esto las solicitudes de unas pruebas
+    contarían para el límite de las siguientes.
+    """
+    if "security_client" in request.fixturenames:
+        from src.api.middleware.rate_limiter import RateLimiter
+        
+        # Recorrer la pila de middleware ya construida hasta el limitador
+        node = request.getfixturevalue("security_client").app.middleware_stack
+        while node is not None:
+            if isinstance(node, RateLimiter):
+                node.request_store.clear()
+                break
+            node = getattr(node, "app", None)
+    yield
+
+@pytest.fixture(scope="session")
 def test_user():
     """
     Fixture que proporciona un usuario de prueba.
@@ -29,14 +85,9 @@ def test_user():
     Returns:
         dict: Datos del usuario de prueba.
     """
-    return {
-        "user_id": "test_user_id",
-        "username": "test_user",
-        "password": "test_password",
-        "permissions": ["read:analytics", "read:models"]
-    }
+    return dict(TEST_USER)
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_admin():
     """
     Fixture que proporciona un administrador de prueba.
@@ -44,68 +95,44 @@ def test_admin():
     Returns:
         dict: Datos del administrador de prueba.
     """
-    return {
-        "user_id": "admin_user_id",
-        "username": "admin_user",
-        "password": "admin_password",
-        "role": "admin"
-    }
+    return dict(TEST_ADMIN)
 
-@pytest.fixture
-def user_token(test_user):
+@pytest.fixture(scope="session")
+def user_token():
     """
     Fixture que proporciona un token de usuario para pruebas.
     
-    Args:
-        test_user: Fixture con datos del usuario de prueba.
-        
     Returns:
-        str: Token JWT para el usuario de prueba.
+        str: Token JWT (precalculado) para el usuario de prueba.
     """
-    return create_test_user_token(
-        user_id=test_user["user_id"],
-        username=test_user["username"],
-        permissions=test_user["permissions"]
-    )
+    return USER_TOKEN
 
-@pytest.fixture
-def admin_token(test_admin):
+@pytest.fixture(scope="session")
+def admin_token():
     """
     Fixture que proporciona un token de administrador para pruebas.
     
-    Args:
-        test_admin: Fixture con datos del administrador de prueba.
-        
     Returns:
-        str: Token JWT para el administrador de prueba.
+        str: Token JWT (precalculado) para el administrador de prueba.
     """
-    return create_test_admin_token(
-        user_id=test_admin["user_id"],
-        username=test_admin["username"]
-    )
+    return ADMIN_TOKEN
 
-@pytest.fixture
-def auth_headers(user_token):
+@pytest.fixture(scope="session")
+def auth_headers():
     """
     Fixture que proporciona encabezados de autorización para un usuario normal.
     
-    Args:
-        user_token: Fixture con el token del usuario.
-        
     Returns:
         dict: Encabezados de autorización.
     """
-    return get_auth_headers(user_token)
+    return AUTH_HEADERS
 
-@pytest.fixture
-def admin_headers(admin_token):
+@pytest.fixture(scope="session")
+def admin_headers():
     """
     Fixture que proporciona encabezados de autorización para un administrador.
     
-    Args:
-        admin_token: Fixture con el token del administrador.
-        
     Returns:
         dict: Encabezados de autorización.
     """
-    return get_auth_headers(admin_token)
+    return ADMIN_HEADERS
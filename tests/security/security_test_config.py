@@ -5,30 +5,85 @@ Este módulo proporciona funciones y variables de configuración
 para las pruebas de seguridad de la API.
 """
 
-import os
 import jwt
+import json
+import hmac
+import base64
+import hashlib
+import calendar
 import httpx
 from datetime import datetime, timedelta
 from fastapi import FastAPI
 from starlette.testclient import TestClient as StarletteTestClient
 from starlette.types import ASGIApp
 
+# orjson es opcional: si no está instalado se usa el json estándar
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Configuración de JWT para pruebas
 JWT_SECRET = "test_secret_key_for_testing_only"
 JWT_ALGORITHM = "HS256"
 JWT_ACCESS_TOKEN_EXPIRE_MINUTES = 30
 JWT_REFRESH_TOKEN_EXPIRE_DAYS = 7
 
-# Asegurar que las variables de entorno estén configuradas para las pruebas
-os.environ["ENVIRONMENT"] = "testing"
-os.environ["JWT_SECRET"] = JWT_SECRET
-os.environ["JWT_ALGORITHM"] = JWT_ALGORITHM
-os.environ["JWT_ACCESS_TOKEN_EXPIRE_MINUTES"] = str(JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
-os.environ["JWT_REFRESH_TOKEN_EXPIRE_DAYS"] = str(JWT_REFRESH_TOKEN_EXPIRE_DAYS)
-os.environ["RATE_LIMIT_PER_MINUTE"] = "60"
-os.environ["RATE_LIMIT_PER_HOUR"] = "1000"
-os.environ["LOG_LEVEL"] = "INFO"
-os.environ["ALLOWED_ORIGINS"] = "http://testserver,http://localhost:8000"
+# Variables de entorno de las pruebas de seguridad. Se aplican desde un
+# fixture de sesión (ver conftest.py) y no al importar el módulo, para que
+# cada proceso de pytest-xdist las fije antes de importar la aplicación.
+SECURITY_TEST_ENV = {
+    "ENVIRONMENT": "testing",
+    "JWT_SECRET": JWT_SECRET,
+    "JWT_ALGORITHM": JWT_ALGORITHM,
+    "JWT_ACCESS_TOKEN_EXPIRE_MINUTES": str(JWT_ACCESS_TOKEN_EXPIRE_MINUTES),
+    "JWT_REFRESH_TOKEN_EXPIRE_DAYS": str(JWT_REFRESH_TOKEN_EXPIRE_DAYS),
+    "RATE_LIMIT_PER_MINUTE": "60",
+    "RATE_LIMIT_PER_HOUR": "1000",
+    "LOG_LEVEL": "INFO",
+    "ALLOWED_ORIGINS": "http://testserver,http://localhost:8000",
+}
+
+# Usuarios de prueba compartidos por los fixtures de seguridad
+TEST_USER = {
+    "user_id": "test_user_id",
+    "username": "test_user",
+    "password": "test_password",
+    "permissions": ["read:analytics", "read:models"]
+}
+
+TEST_ADMIN = {
+    "user_id": "admin_user_id",
+    "username": "admin_user",
+    "password": "admin_password",
+    "role": "admin"
+}
+
+# Vigencia de los tokens precalculados al importar el módulo (debe cubrir
+# toda la ejecución de la suite)
+PRECOMPUTED_TOKEN_LIFETIME = timedelta(days=1)
+
+class _PortalFactory:
+    """Portal síncrono que funciona como administrador de contexto."""
+    
+    def __call__(self, func=None, *args):
+        if func is not None:
+            return func(*args)
+        return self
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+        
+    def call(self, func, *args):
+        # Ejecutar la función directamente
+        return func(*args)
+
+# Instancia compartida por todos los clientes de prueba (no guarda estado)
+_PORTAL_FACTORY = _PortalFactory()
 
 class CompatibleTestClient(httpx.Client):
     """Cliente de prueba compatible con versiones recientes de httpx."""
@@ -40,28 +95,9 @@ class CompatibleTestClient(httpx.Client):
         self.app = app
         self.app_state = {}
         
-        # Creamos un portal_factory que funcione como administrador de contexto
-        class PortalFactory:
-            def __call__(self, func=None, *args):
-                if func is not None:
-                    return func(*args)
-                return self
-                
-            def __enter__(self):
-                return self
-                
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                pass
-                
-            def call(self, func, *args):
-                # Ejecutar la función directamente
-                return func(*args)
-        
-        portal_factory = PortalFactory()
-        
         transport = _TestClientTransport(
             self.app,
-            portal_factory=portal_factory,
+            portal_factory=_PORTAL_FACTORY,
             raise_server_exceptions=True,
             root_path="",
             app_state=self.app_state
@@ -85,6 +121,37 @@ def get_test_client():
     from src.api.main import app
     return CompatibleTestClient(app)
 
+# Cabecera JWT fija para HS256 ({"alg":"HS256","typ":"JWT"} en base64url)
+_JWT_HS256_HEADER = b"eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9"
+_JWT_SECRET_BYTES = JWT_SECRET.encode()
+
+def _b64url(raw):
+    """Codifica en base64url sin relleno, como exige JWT."""
+    return base64.urlsafe_b64encode(raw).rstrip(b"=")
+
+def _fast_jwt(payload):
+    """
+    Firma un token HS256 con hmac/hashlib, sin pasar por PyJWT.
+    
+    Las fechas se convierten a timestamps enteros, igual que hace PyJWT, así
+    que la API bajo prueba lo decodifica con jwt.decode sin diferencias.
+    
+    Args:
+        payload (dict): Claims del token.
+        
+    Returns:
+        str: Token JWT generado.
+    """
+    claims = {
+        key: calendar.timegm(value.utctimetuple()) if isinstance(value, datetime) else value
+        for key, value in payload.items()
+    }
+    signing_input = _JWT_HS256_HEADER + b"." + _b64url(
+        json.dumps(claims, separators=(",", ":")).encode()
+    )
+    signature = hmac.new(_JWT_SECRET_BYTES, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
+
 def create_test_token(data, expires_delta=None, token_type="access"):
     """
     Crea un token JWT para pruebas.
@@ -114,9 +181,22 @@ def create_test_token(data, expires_delta=None, token_type="access"):
         "type": token_type
     })
     
-    # Generar token
-    encoded_jwt = jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
-    return encoded_jwt
+    # Generar token (firma directa para HS256; PyJWT para otros algoritmos)
+    if JWT_ALGORITHM == "HS256":
+        return _fast_jwt(to_encode)
+    return jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
+
+def response_body(response):
+    """
+    Decodifica el cuerpo JSON de una respuesta (con orjson si está disponible).
+    
+    Args:
+        response: Respuesta HTTP del cliente de prueba.
+        
+    Returns:
+        Any: Cuerpo de la respuesta decodificado.
+    """
+    return _json_loads(response.content)
 
 def get_auth_headers(token):
     """
@@ -130,10 +210,21 @@ def get_auth_headers(token):
     """
     return {"Authorization": f"Bearer {token}"}
 
+def _token_key(user_id, username, permissions, role):
+    """Clave de los tokens precalculados para unos claims de usuario."""
+    return (user_id, username, tuple(permissions or ()), role)
+
+# Tokens ya firmados, por claims de usuario (se rellena al final del módulo)
+_PRECOMPUTED_TOKENS = {}
+
 def create_test_user_token(user_id="test_user", username="test_user", permissions=None, role=None):
     """
     Crea un token para un usuario de prueba.
     
+    Para los usuarios de prueba estándar (TEST_USER y TEST_ADMIN) devuelve el
+    token precalculado al importar el módulo; solo firma uno nuevo con claims
+    distintos.
+    
     Args:
         user_id (str, optional): ID del usuario.
         username (str, optional): Nombre de usuario.
@@ -143,6 +234,10 @@ def create_test_user_token(user_id="test_user", username="test_user", permission
     Returns:
         str: Token JWT generado.
     """
+    token = _PRECOMPUTED_TOKENS.get(_token_key(user_id, username, permissions, role))
+    if token is not None:
+        return token
+    
     data = {"sub": user_id, "username": username}
     if permissions:
         data["permissions"] = permissions
@@ -168,3 +263,27 @@ def create_test_admin_token(user_id="admin_user", username="admin_user"):
         permissions=["*"],
         role="admin"
     )
+
+def _precompute_token(user_id, username, permissions, role=None):
+    """
+    Firma una sola vez el token de un usuario de prueba estándar.
+    
+    Returns:
+        str: Token JWT generado.
+    """
+    data = {"sub": user_id, "username": username}
+    if permissions:
+        data["permissions"] = permissions
+    if role:
+        data["role"] = role
+    token = create_test_token(data, expires_delta=PRECOMPUTED_TOKEN_LIFETIME)
+    _PRECOMPUTED_TOKENS[_token_key(user_id, username, permissions, role)] = token
+    return token
+
+# Tokens de los usuarios de prueba estándar, firmados una vez por proceso
+USER_TOKEN = _precompute_token(
+    TEST_USER["user_id"], TEST_USER["username"], TEST_USER["permissions"]
+)
+ADMIN_TOKEN = _precompute_token(
+    TEST_ADMIN["user_id"], TEST_ADMIN["username"], ["*"], role="admin"
+)
@@ -11,37 +11,70 @@ import jwt
 import os
 from fastapi.testclient import TestClient
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from tests.security.security_test_config import (
     get_test_client, create_test_token, get_auth_headers,
-    create_test_user_token, create_test_admin_token, JWT_SECRET, JWT_ALGORITHM
+    create_test_user_token, create_test_admin_token, response_body
 )
 
+@pytest.fixture(scope="module")
+def expired_token(jwt_env):
+    """
+    Token firmado correctamente pero expirado, creado una vez por módulo.
+    
+    Returns:
+        str: Token JWT expirado hace 5 minutos.
+    """
+    now = datetime.utcnow()
+    payload = {
+        "sub": "test_user",
+        "permissions": ["read:models"],
+        "exp": now - timedelta(minutes=5),  # Expirado hace 5 minutos
+        "iat": now - timedelta(hours=2),
+        "type": "access"  # Debe ser 'type', no 'token_type'
+    }
+    return jwt.encode(payload, jwt_env.secret, algorithm=jwt_env.alg)
+
 class TestSecurityMeasures:
     """Pruebas para las medidas de seguridad."""
     
-    def test_rate_limiting(self, security_client):
+    def test_rate_limiting(self, monkeypatch):
+        """Prueba que la ventana de limitación de tasa corte al superar el límite."""
+        from fastapi import FastAPI
+        from src.api.middleware import rate_limiter
+        
+        # Congelar el reloj del limitador: todas las solicitudes caen en el mismo minuto
+        monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(time=lambda: 1_000_000.0))
+        limiter = rate_limiter.RateLimiter(FastAPI(), requests_per_minute=60)
+        
+        num_requests = 70  # Más que el límite por minuto
+        results = [limiter._check_rate_limit("ip:testclient") for _ in range(num_requests)]
+        
+        success_count = sum(1 for exceeded, _ in results if not exceeded)
+        limited_count = sum(1 for exceeded, _ in results if exceeded)
+        
+        # Se admiten exactamente las solicitudes del límite y se limitan las demás
+        assert success_count == limiter.requests_per_minute
+        assert limited_count == num_requests - limiter.requests_per_minute
+        # Las solicitudes limitadas indican cuándo reintentar
+        assert all(retry_after for exceeded, retry_after in results if exceeded)
+    
+    def test_rate_limiting_response(self, security_client, monkeypatch):
         # Usar el cliente de prueba proporcionado por el fixture
         client = security_client
-        """Prueba que la limitación de tasa funcione correctamente."""
-        # Realizar múltiples solicitudes rápidamente
-        endpoint = "/health"
-        num_requests = 70  # Más que el límite por minuto
+        """Prueba que el middleware devuelva 429 cuando se excede el límite."""
+        from src.api.middleware.rate_limiter import RateLimiter
+        
+        # Simular que la tercera solicitud excede el límite
+        calls = []
+        def fake_check_rate_limit(self, key):
+            calls.append(key)
+            return (True, 30) if len(calls) > 2 else (False, None)
+        monkeypatch.setattr(RateLimiter, "_check_rate_limit", fake_check_rate_limit)
+        
+        status_codes = [client.get("/health").status_code for _ in range(3)]
         
-        responses = []
-        for _ in range(num_requests):
-            response = client.get(endpoint)
-            responses.append(response)
-        
-        # Verificar que algunas solicitudes fueron limitadas
-        success_count = sum(1 for r in responses if r.status_code == 200)
-        limited_count = sum(1 for r in responses if r.status_code == 429)
-        
-        # Debe haber al menos una solicitud limitada
-        assert limited_count > 0
-        # Y algunas solicitudes exitosas
-        assert success_count > 0
-        # El total debe ser igual al número de solicitudes
-        assert success_count + limited_count == num_requests
+        assert status_codes == [200, 200, 429]
     
     def test_security_headers(self, security_client):
         # Usar el cliente de prueba proporcionado por el fixture
@@ -51,28 +84,29 @@ class TestSecurityMeasures:
         response = client.get("/health")
         
         # Verificar encabezados de seguridad
-        assert "X-Content-Type-Options" in response.headers
-        assert response.headers["X-Content-Type-Options"] == "nosniff"
+        headers = response.headers
+        assert "X-Content-Type-Options" in headers
+        assert headers["X-Content-Type-Options"] == "nosniff"
         
-        assert "X-Frame-Options" in response.headers
-        assert response.headers["X-Frame-Options"] == "DENY"
+        assert "X-Frame-Options" in headers
+        assert headers["X-Frame-Options"] == "DENY"
         
-        assert "X-XSS-Protection" in response.headers
-        assert response.headers["X-XSS-Protection"] == "1; mode=block"
+        assert "X-XSS-Protection" in headers
+        assert headers["X-XSS-Protection"] == "1; mode=block"
         
-        assert "Strict-Transport-Security" in response.headers
-        assert "max-age=31536000" in response.headers["Strict-Transport-Security"]
-        assert "includeSubDomains" in response.headers["Strict-Transport-Security"]
+        assert "Strict-Transport-Security" in headers
+        assert "max-age=31536000" in headers["Strict-Transport-Security"]
+        assert "includeSubDomains" in headers["Strict-Transport-Security"]
         
-        assert "Content-Security-Policy" in response.headers
-        assert "default-src 'self'" in response.headers["Content-Security-Policy"]
-        assert "script-src 'self'" in response.headers["Content-Security-Policy"]
-        assert "object-src 'none'" in response.headers["Content-Security-Policy"]
+        assert "Content-Security-Policy" in headers
+        assert "default-src 'self'" in headers["Content-Security-Policy"]
+        assert "script-src 'self'" in headers["Content-Security-Policy"]
+        assert "object-src 'none'" in headers["Content-Security-Policy"]
         
-        assert "X-Request-ID" in response.headers
-        assert len(response.headers["X-Request-ID"]) > 0
+        assert "X-Request-ID" in headers
+        assert len(headers["X-Request-ID"]) > 0
     
-    def test_token_expiration(self, security_client, test_user):
+    def test_token_expiration(self, security_client, test_user, jwt_env):
         # Usar el cliente de prueba proporcionado por el fixture
         client = security_client
         """Prueba que los tokens expiren correctamente."""
@@ -85,7 +119,7 @@ class TestSecurityMeasures:
             }
         )
         
-        # Obtener token
+        # Obtener token (response.json() se mantiene aquí para cubrir httpx)
         token = login_response.json()["data"]["access_token"]
         
         # Decodificar token para verificar tiempo de expiración
@@ -100,7 +134,7 @@ class TestSecurityMeasures:
         time_until_expiration = expiration_time - now
         
         # Verificar que el tiempo de expiración es aproximadamente el esperado
-        expected_expiration = timedelta(minutes=int(pytest.MonkeyPatch().context.environ.get("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", 30)))
+        expected_expiration = timedelta(minutes=jwt_env.exp_min)
         assert abs((time_until_expiration - expected_expiration).total_seconds()) < 60  # Margen de 1 minuto
     
     def test_invalid_token_rejection(self, security_client):
@@ -118,27 +152,16 @@ class TestSecurityMeasures:
         
         # Verificar que se rechaza el token
         assert response.status_code == 401
-        assert response.json()["success"] is False
-        assert "error" in response.json()
-        assert "code" in response.json()["error"]
-        assert response.json()["error"]["code"] == "UNAUTHORIZED"
+        body = response_body(response)
+        assert body["success"] is False
+        assert "error" in body
+        assert "code" in body["error"]
+        assert body["error"]["code"] == "UNAUTHORIZED"
     
-    def test_expired_token_rejection(self, security_client):
+    def test_expired_token_rejection(self, security_client, expired_token):
         # Usar el cliente de prueba proporcionado por el fixture
         client = security_client
         """Prueba que los tokens expirados sean rechazados."""
-        # Crear un token expirado manualmente
-        payload = {
-            "sub": "test_user",
-            "permissions": ["read:models"],
-            "exp": datetime.utcnow() - timedelta(minutes=5),  # Expirado hace 5 minutos
-            "iat": datetime.utcnow() - timedelta(hours=2),
-            "type": "access"  # Debe ser 'type', no 'token_type'
-        }
-        
-        # Firmar el token
-        expired_token = jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
-        
         # Intentar acceder a un endpoint protegido
         response = client.get(
             "/auth/me",
@@ -147,10 +170,11 @@ class TestSecurityMeasures:
         
         # Verificar que se rechaza el token
         assert response.status_code == 401
-        assert response.json()["success"] is False
-        assert "error" in response.json()
-        assert "code" in response.json()["error"]
-        assert response.json()["error"]["code"] == "UNAUTHORIZED"
+        body = response_body(response)
+        assert body["success"] is False
+        assert "error" in body
+        assert "code" in body["error"]
+        assert body["error"]["code"] == "UNAUTHORIZED"
     
     def test_permission_enforcement(self, security_client, auth_headers, admin_headers):
         # Usar el cliente de prueba proporcionado por el fixture
@@ -167,10 +191,11 @@ class TestSecurityMeasures:
         
         # Verificar que se rechaza al usuario normal
         assert normal_response.status_code == 403
-        assert normal_response.json()["success"] is False
-        assert "error" in normal_response.json()
-        assert "code" in normal_response.json()["error"]
-        assert normal_response.json()["error"]["code"] == "FORBIDDEN"
+        normal_body = response_body(normal_response)
+        assert normal_body["success"] is False
+        assert "error" in normal_body
+        assert "code" in normal_body["error"]
+        assert normal_body["error"]["code"] == "FORBIDDEN"
         
         # Intentar acceder con administrador
         admin_response = client.get(
@@ -180,7 +205,7 @@ class TestSecurityMeasures:
         
         # Verificar que se permite al administrador
         assert admin_response.status_code == 200
-        assert admin_response.json()["success"] is True
+        assert response_body(admin_response)["success"] is True
     
     def test_input_validation(self, security_client, auth_headers):
         # Usar el cliente de prueba proporcionado por el fixture
@@ -207,11 +232,12 @@ class TestSecurityMeasures:
         
         # Verificar respuesta de error de validación
         assert response.status_code == 422
-        assert response.json()["success"] is False
-        assert "error" in response.json()
-        assert "code" in response.json()["error"]
-        assert response.json()["error"]["code"] == "VALIDATION_ERROR"
-        assert "role" in response.json()["error"]["message"].lower()  # El mensaje debe mencionar el campo inválido
+        body = response_body(response)
+        assert body["success"] is False
+        assert "error" in body
+        assert "code" in body["error"]
+        assert body["error"]["code"] == "VALIDATION_ERROR"
+        assert "role" in body["error"]["message"].lower()  # El mensaje debe mencionar el campo inválido
     
     def test_error_sanitization(self, security_client):
         # Usar el cliente de prueba proporcionado por el fixture
@@ -8,7 +8,6 @@ from unittest.mock import AsyncMock, MagicMock
 
 from src.services.conversion_prediction_service import ConversionPredictionService
 from src.services.predictive_model_service import PredictiveModelService
-from src.services.nlp_integration_service import NLPIntegrationService
 from src.integrations.supabase.resilient_client import ResilientSupabaseClient
 
 # Importar fixtures comunes
@@ -20,23 +19,6 @@ from tests.fixtures.predictive_fixtures import (
 )
 
 
-class DummyNLP(NLPIntegrationService):
-    """Mock mínimo de NLPIntegrationService."""
-
-    async def analyze_sentiment(self, *args, **kwargs):
-        return {
-            "positive": 0.8,
-            "negative": 0.2,
-            "neutral": 0.0,
-        }
-        
-    async def extract_keywords(self, *args, **kwargs):
-        return ["precio", "calidad", "soporte"]
-        
-    async def analyze_entities(self, *args, **kwargs):
-        return {"products": ["producto1"], "features": ["característica1"]}
-
-
 @pytest.fixture
 def conversion_service(mock_supabase_client, mock_nlp_service, mock_predictive_model_service, 
                       mock_entity_recognition_service, mock_keyword_extraction_service):
@@ -68,23 +50,17 @@ def conversion_service(mock_supabase_client, mock_nlp_service, mock_predictive_m
 
 
 @pytest.mark.wip
-@pytest.mark.asyncio
-async def test_get_conversion_category(conversion_service):
+@pytest.mark.parametrize("probability, expected", [
+    (0.3, "low"),
+    (0.5, "medium"),
+    (0.8, "high"),
+])
+def test_get_conversion_category(conversion_service, probability, expected):
     """Test para obtener categoría de conversión"""
-    # Definir umbrales para las categorías
+    # Umbrales para las categorías
     thresholds = {"medium": 0.4, "high": 0.7}
     
-    # Probar con probabilidad baja
-    category = conversion_service._get_conversion_category(0.3, thresholds)
-    assert category == "low"
-    
-    # Probar con probabilidad media
-    category = conversion_service._get_conversion_category(0.5, thresholds)
-    assert category == "medium"
-    
-    # Probar con probabilidad alta
-    category = conversion_service._get_conversion_category(0.8, thresholds)
-    assert category == "high"
+    assert conversion_service._get_conversion_category(probability, thresholds) == expected
 
 @pytest.mark.wip
 @pytest.mark.asyncio
@@ -0,0 +1,65 @@
+"""
+Pruebas unitarias para la caché de payloads JWT.
+
+Este módulo contiene pruebas para verificar que la caché solo sirve
+payloads validados y que respeta la expiración de los tokens.
+"""
+
+import time
+import pytest
+from src.auth import jwt_cache
+from src.auth.jwt_cache import cache_payload, clear_jwt_cache, get_cached_payload
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    """Vacía la caché antes y después de cada prueba."""
+    clear_jwt_cache()
+    yield
+    clear_jwt_cache()
+
+class TestJWTCache:
+    """Pruebas para la caché de payloads JWT."""
+    
+    def test_cache_hit_returns_copy(self):
+        """Un token guardado se recupera como copia del payload."""
+        payload = {"sub": "test_user", "exp": time.time() + 60}
+        cache_payload("token-a", payload)
+        
+        cached = get_cached_payload("token-a")
+        assert cached == payload
+        
+        # Modificar la copia no altera la entrada de la caché
+        cached["sub"] = "otro"
+        assert get_cached_payload("token-a")["sub"] == "test_user"
+    
+    def test_cache_miss(self):
+        """Un token no guardado no tiene entrada."""
+        assert get_cached_payload("token-desconocido") is None
+    
+    def test_expired_entry_is_not_served(self):
+        """Las entradas no sobreviven al exp del token."""
+        cache_payload("token-a", {"sub": "test_user", "exp": time.time() - 1})
+        assert get_cached_payload("token-a") is None
+    
+    def test_payload_without_exp_is_not_cached(self):
+        """Los tokens sin exp numérico no se guardan."""
+        cache_payload("token-a", {"sub": "test_user"})
+        assert get_cached_payload("token-a") is None
+    
+    def test_eviction_when_full(self, monkeypatch):
+        """Con la caché llena se descarta la entrada más antigua."""
+        monkeypatch.setattr(jwt_cache, "JWT_CACHE_MAX_SIZE", 2)
+        exp = time.time() + 60
+        cache_payload("token-a", {"sub": "a", "exp": exp})
+        cache_payload("token-b", {"sub": "b", "exp": exp})
+        cache_payload("token-c", {"sub": "c", "exp": exp})
+        
+        assert get_cached_payload("token-a") is None
+        assert get_cached_payload("token-b")["sub"] == "b"
+        assert get_cached_payload("token-c")["sub"] == "c"
+    
+    def test_disabled_with_zero_ttl(self, monkeypatch):
+        """Con TTL 0 la caché no guarda nada."""
+        monkeypatch.setattr(jwt_cache, "JWT_CACHE_TTL_SECONDS", 0)
+        cache_payload("token-a", {"sub": "test_user", "exp": time.time() + 60})
+        assert get_cached_payload("token-a") is None
@@ -19,7 +19,7 @@ from src.auth.jwt_functions import (
 class TestJWTHandler:
     """Pruebas para el manejador de JWT."""
     
-    def test_create_access_token(self):
+    def test_create_access_token(self, jwt_env):
         """Prueba la creación de un token de acceso."""
         # Datos para el token
         data = {"sub": "test_user", "permissions": ["read:models"]}
@@ -34,8 +34,8 @@ class TestJWTHandler:
         # Decodificar token para verificar contenido
         decoded = jwt.decode(
             token,
-            key=pytest.MonkeyPatch().context.environ.get("JWT_SECRET", "test_secret_key_for_testing_only"),
-            algorithms=[pytest.MonkeyPatch().context.environ.get("JWT_ALGORITHM", "HS256")]
+            key=jwt_env.secret,
+            algorithms=[jwt_env.alg]
         )
         
         # Verificar que los datos están presentes
@@ -45,7 +45,7 @@ class TestJWTHandler:
         assert "iat" in decoded
         assert decoded["token_type"] == "access"
     
-    def test_create_access_token_with_expiration(self):
+    def test_create_access_token_with_expiration(self, jwt_env):
         """Prueba la creación de un token de acceso con tiempo de expiración personalizado."""
         # Datos para el token
         data = {"sub": "test_user"}
@@ -57,15 +57,15 @@ class TestJWTHandler:
         # Decodificar token
         decoded = jwt.decode(
             token,
-            key=pytest.MonkeyPatch().context.environ.get("JWT_SECRET", "test_secret_key_for_testing_only"),
-            algorithms=[pytest.MonkeyPatch().context.environ.get("JWT_ALGORITHM", "HS256")]
+            key=jwt_env.secret,
+            algorithms=[jwt_env.alg]
         )
         
         # Verificar tiempo de expiración
         now = datetime.utcnow().timestamp()
         assert decoded["exp"] - now <= 5 * 60 + 1  # 5 minutos + 1 segundo de margen
     
-    def test_create_refresh_token(self):
+    def test_create_refresh_token(self, jwt_env):
         """Prueba la creación de un token de refresco."""
         # Datos para el token
         data = {"sub": "test_user"}
@@ -80,8 +80,8 @@ class TestJWTHandler:
         # Decodificar token
         decoded = jwt.decode(
             token,
-            key=pytest.MonkeyPatch().context.environ.get("JWT_SECRET", "test_secret_key_for_testing_only"),
-            algorithms=[pytest.MonkeyPatch().context.environ.get("JWT_ALGORITHM", "HS256")]
+            key=jwt_env.secret,
+            algorithms=[jwt_env.alg]
         )
         
         # Verificar que los datos están presentes
@@ -152,14 +152,14 @@ class TestJWTHandler:
         with pytest.raises(Exception):
             verify_token(token)
     
-    def test_verify_token_missing_sub(self):
+    def test_verify_token_missing_sub(self, jwt_env):
         """Prueba la verificación de un token sin campo 'sub'."""
         # Datos para el token sin 'sub'
         data = {"permissions": ["read:models"]}
         
         # Crear token manualmente
-        secret = pytest.MonkeyPatch().context.environ.get("JWT_SECRET", "test_secret_key_for_testing_only")
-        algorithm = pytest.MonkeyPatch().context.environ.get("JWT_ALGORITHM", "HS256")
+        secret = jwt_env.secret
+        algorithm = jwt_env.alg
         expiration = datetime.utcnow() + timedelta(minutes=30)
         
         payload = {
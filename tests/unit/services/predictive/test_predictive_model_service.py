@@ -250,3 +250,38 @@ class TestPredictiveModelService:
         assert insert_data["feedback_data"] == json.dumps(feedback_data)
         assert insert_data["user_id"] == user_id
         assert "created_at" in insert_data
+
+
+@pytest.fixture
+def training_data_service():
+    """Servicio con un cliente de Supabase simulado para la tabla de entrenamiento."""
+    supabase_mock = MagicMock()
+    return PredictiveModelService(supabase_mock), supabase_mock
+
+
+@pytest.mark.asyncio
+async def test_mark_training_data_used(training_data_service):
+    """Prueba que los datos de entrenamiento se marcan en una sola actualización."""
+    service, supabase_mock = training_data_service
+    supabase_mock.reset_mock()
+    update_mock = supabase_mock.table.return_value.update.return_value
+    
+    result = await service.mark_training_data_used(["1", "2", "3"])
+    
+    assert result is True
+    supabase_mock.table.assert_called_once_with("model_training_data")
+    supabase_mock.table.return_value.update.assert_called_once_with({"used_in_training": True})
+    update_mock.in_.assert_called_once_with("id", ["1", "2", "3"])
+    update_mock.in_.return_value.execute.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_mark_training_data_used_empty(training_data_service):
+    """Prueba que una lista vacía no genera ninguna consulta."""
+    service, supabase_mock = training_data_service
+    supabase_mock.reset_mock()
+    
+    result = await service.mark_training_data_used([])
+    
+    assert result is True
+    supabase_mock.table.assert_not_called()
@@ -171,3 +171,33 @@ class TestAdvancedSentimentService:
         assert "urgency" in result
         assert "indecision" in result
         assert "detailed" in result
+    
+    def test_analyze_sentiment_changes(self, sentiment_service):
+        """Prueba que analyze_sentiment_changes calcule las métricas de la serie de puntuaciones."""
+        result = sentiment_service.analyze_sentiment_changes([0.5, 0.2, -0.4])
+        
+        assert result["trend"] == "empeorando"
+        assert result["delta"] == pytest.approx(-0.9)
+        assert result["magnitude"] == pytest.approx(0.9)
+        assert result["average"] == pytest.approx(0.1)
+        assert result["positive_peaks"] == 2
+        assert result["negative_dips"] == 1
+        assert 0 < result["stability"] <= 1.0
+    
+    def test_analyze_sentiment_changes_single_score(self, sentiment_service):
+        """Prueba que una sola puntuación se trate como serie estable."""
+        result = sentiment_service.analyze_sentiment_changes([-0.6])
+        
+        assert result["trend"] == "estable"
+        assert result["delta"] == 0.0
+        assert result["average"] == pytest.approx(-0.6)
+        assert result["negative_dips"] == 1
+        assert result["positive_peaks"] == 0
+        assert result["stability"] == 1.0
+    
+    def test_analyze_sentiment_changes_empty(self, sentiment_service):
+        """Prueba que analyze_sentiment_changes maneje una serie vacía."""
+        result = sentiment_service.analyze_sentiment_changes([])
+        
+        assert result["trend"] == "estable"
+        assert result["magnitude"] == 0.0
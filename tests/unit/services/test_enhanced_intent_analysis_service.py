@@ -48,8 +48,8 @@ class TestEnhancedIntentAnalysisService:
         }
         
         # Configurar métodos
-        mock_service._analyze_sentiment = AsyncMock(side_effect=[0.7, -0.6, 0.1])
-        mock_service._analyze_engagement = AsyncMock(side_effect=[0.8, 0.2])
+        mock_service._analyze_sentiment = MagicMock(side_effect=[0.7, -0.6, 0.1])
+        mock_service._analyze_engagement = MagicMock(side_effect=[0.8, 0.2])
         mock_service._extract_keywords = MagicMock(side_effect=[["precio", "interesa", "pagar"], ["no me interesa", "tal vez después"]])
         mock_service.analyze_purchase_intent = AsyncMock(side_effect=[
             # Primera llamada: intención positiva
@@ -283,9 +283,9 @@ class TestEnhancedIntentAnalysisService:
             ]
             
             # Analizar sentimiento
-            positive_score = await mock_intent_service._analyze_sentiment(positive_messages)
-            negative_score = await mock_intent_service._analyze_sentiment(negative_messages)
-            neutral_score = await mock_intent_service._analyze_sentiment(neutral_messages)
+            positive_score = mock_intent_service._analyze_sentiment(positive_messages)
+            negative_score = mock_intent_service._analyze_sentiment(negative_messages)
+            neutral_score = mock_intent_service._analyze_sentiment(neutral_messages)
             
             assert positive_score > 0
             assert negative_score < 0
@@ -312,8 +312,8 @@ class TestEnhancedIntentAnalysisService:
             ]
             
             # Analizar engagement
-            high_score = await mock_intent_service._analyze_engagement(high_engagement)
-            low_score = await mock_intent_service._analyze_engagement(low_engagement)
+            high_score = mock_intent_service._analyze_engagement(high_engagement)
+            low_score = mock_intent_service._analyze_engagement(low_engagement)
             
             assert high_score > 0.5
             assert low_score < 0.3
@@ -351,27 +351,30 @@ class TestEnhancedIntentAnalysisService:
                 {"role": "user", "content": "Me interesa el programa."}
             ]
             
-            # Tiempo de inicio reciente
-            recent_start_time = datetime.now() - timedelta(minutes=5)
+            # Instante de referencia fijo para todos los casos
+            now = datetime.now()
             
-            # Verificar que debería continuar (hay intención de compra)
-            should_continue, reason = await mock_intent_service.should_continue_conversation(
-                messages, recent_start_time, intent_detection_timeout=300
-            )
-            
-            assert should_continue is True
-            assert reason is None
+            # Tiempo de inicio reciente y antiguo (este último excede el timeout)
+            recent_start_time = now - timedelta(minutes=5)
+            old_start_time = now - timedelta(minutes=10)
             
-            # Tiempo de inicio antiguo (excede el timeout)
-            old_start_time = datetime.now() - timedelta(minutes=10)
-            
-            # Verificar que no debería continuar (no hay intención y excede timeout)
-            should_continue, reason = await mock_intent_service.should_continue_conversation(
-                messages, old_start_time, intent_detection_timeout=300
+            # Los dos casos son independientes: evaluarlos a la vez
+            (recent_continue, recent_reason), (old_continue, old_reason) = await asyncio.gather(
+                mock_intent_service.should_continue_conversation(
+                    messages, recent_start_time, intent_detection_timeout=300
+                ),
+                mock_intent_service.should_continue_conversation(
+                    messages, old_start_time, intent_detection_timeout=300
+                )
             )
             
-            assert should_continue is False
-            assert reason == "no_intent_detected"
+            # Debería continuar (hay intención de compra)
+            assert recent_continue is True
+            assert recent_reason is None
+            
+            # No debería continuar (no hay intención y excede timeout)
+            assert old_continue is False
+            assert old_reason == "no_intent_detected"
     
     @pytest.mark.asyncio
     async def test_update_model_from_conversation(self, mock_intent_service, mock_resilient_client):